@@ -18,20 +18,76 @@ Coordinate System:
         local_z = world_z % CHUNK_SIZE
 """
 
-from ursina import Entity, Mesh, Vec3, load_texture, color
+from ursina import Entity, Mesh, Vec3, Shader, load_texture, color
 from typing import List, Tuple, Optional, Dict, TYPE_CHECKING
-import math
 
-from voxel import (
-    BlockType, Face, FACE_DIRECTIONS, FACE_VERTICES, 
-    FACE_UVS, QUAD_INDICES, get_block_uvs, ATLAS_WIDTH
+import numpy as np
+
+from voxel import BlockType, AIR_ID, ATLAS_WIDTH, FACE_DIRECTIONS
+from mesher import (
+    greedy_mesh, vectorized_mesh, splice_slices, quad_triangles,
+    TILE_UV_STRIDE, TILE_UV_MARGIN,
 )
+from jit import NUMBA_AVAILABLE
 
 if TYPE_CHECKING:
     from world import World
 
 # Chunk dimensions
 CHUNK_SIZE = 16
+# World <-> chunk coordinate conversion uses shifts and masks instead of // and %
+assert CHUNK_SIZE & (CHUNK_SIZE - 1) == 0, "CHUNK_SIZE must be a power of two"
+CHUNK_SHIFT = CHUNK_SIZE.bit_length() - 1  # world >> CHUNK_SHIFT == world // CHUNK_SIZE
+CHUNK_MASK = CHUNK_SIZE - 1                # world & CHUNK_MASK == world % CHUNK_SIZE
+
+# Unlit shader for greedy-meshed chunks. Merged quads carry tile-encoded
+# UVs (see mesher.py); the fragment shader repeats the texture inside the
+# quad's atlas tile instead of stretching it across the atlas.
+ATLAS_TILING_SHADER = Shader(
+    name='atlas_tiling_shader',
+    language=Shader.GLSL,
+    vertex='''#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+in vec4 p3d_Vertex;
+in vec2 p3d_MultiTexCoord0;
+out vec2 texcoords;
+
+void main() {
+    gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+    texcoords = p3d_MultiTexCoord0;
+}
+''',
+    fragment=f'''#version 140
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+in vec2 texcoords;
+out vec4 fragColor;
+
+void main() {{
+    float tile = floor(texcoords.x / {TILE_UV_STRIDE:.1f});
+    float local_u = texcoords.x - tile * {TILE_UV_STRIDE:.1f} - {TILE_UV_MARGIN:.1f};
+    vec2 atlas_uv = vec2((tile + fract(local_u)) / {float(ATLAS_WIDTH):.1f}, fract(texcoords.y));
+    fragColor = texture(p3d_Texture0, atlas_uv) * p3d_ColorScale;
+}}
+''',
+)
+
+def _border_slab(direction: Tuple[int, int, int]) -> Tuple[tuple, tuple]:
+    """
+    Index pair for one face of the padded border.
+    
+    Returns:
+        (border index into the padded array,
+         boundary index into the neighbor chunk's blocks in that direction)
+    """
+    border = tuple(slice(1, -1) if d == 0 else (-1 if d > 0 else 0) for d in direction)
+    boundary = tuple(slice(None) if d == 0 else (0 if d > 0 else -1) for d in direction)
+    return border, boundary
+
+
+# Padded-border slabs in Face order
+_BORDER_SLABS = [_border_slab(direction) for direction in FACE_DIRECTIONS]
+
 
 class Chunk(Entity):
     """
@@ -64,16 +120,22 @@ class Chunk(Entity):
         self.chunk_pos = chunk_pos
         self.world = world
         
-        # 3D array of blocks: blocks[x][y][z]
-        # Initialize all as AIR
-        self.blocks: List[List[List[BlockType]]] = [
-            [[BlockType.AIR for _ in range(CHUNK_SIZE)] 
-             for _ in range(CHUNK_SIZE)] 
-            for _ in range(CHUNK_SIZE)
-        ]
+        # 3D array of block IDs: blocks[x, y, z]
+        # Stored as uint8 BlockType values (4 KB per chunk), initialized as AIR
+        self.blocks: np.ndarray = np.zeros(
+            (CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8
+        )
         
         self._mesh_dirty = True
         self._texture = None
+        
+        # Bumped on every change; mesh builds started from an older version are discarded
+        self._mesh_version = 0
+        
+        # Last mesh as (vertices, uvs, slice_counts), reused for partial rebuilds
+        self._mesh_cache: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        # Inclusive (min, max) local box of blocks whose faces may have changed
+        self._dirty_aabb: Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = None
     
     def set_block(self, local_x: int, local_y: int, local_z: int, 
                   block_type: BlockType) -> None:
@@ -85,8 +147,46 @@ class Chunk(Entity):
             block_type: Type of block to place
         """
         if 0 <= local_x < CHUNK_SIZE and 0 <= local_y < CHUNK_SIZE and 0 <= local_z < CHUNK_SIZE:
-            self.blocks[local_x][local_y][local_z] = block_type
-            self._mesh_dirty = True
+            block_id = int(block_type)
+            if self.blocks[local_x, local_y, local_z] != block_id:
+                self.blocks[local_x, local_y, local_z] = block_id
+                self.mark_dirty(local_x, local_y, local_z)
+    
+    def fill_from_array(self, blocks: np.ndarray) -> None:
+        """
+        Replace every block in this chunk at once.
+        
+        Copies into the existing array (self.blocks is never rebound) and
+        drops the cached mesh, so the next build meshes the whole chunk.
+        
+        Args:
+            blocks: (CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE) block IDs, indexed [x, y, z]
+        """
+        self.blocks[...] = blocks
+        self._mesh_cache = None
+        self._dirty_aabb = None
+        self.invalidate_mesh()
+    
+    def mark_dirty(self, local_x: int, local_y: int, local_z: int) -> None:
+        """
+        Record that the block at local coordinates changed.
+        
+        The block and its 6 neighbors may gain or lose faces, so the dirty
+        box grows by one block in every direction (clamped to the chunk).
+        Coordinates may lie just outside the chunk, for edits made in a
+        neighbor chunk that touch this chunk's border.
+        
+        Args:
+            local_x, local_y, local_z: Local coordinates (-1 to CHUNK_SIZE)
+        """
+        lo = tuple(max(c - 1, 0) for c in (local_x, local_y, local_z))
+        hi = tuple(min(c + 1, CHUNK_SIZE - 1) for c in (local_x, local_y, local_z))
+        if self._dirty_aabb is not None:
+            old_lo, old_hi = self._dirty_aabb
+            lo = tuple(map(min, lo, old_lo))
+            hi = tuple(map(max, hi, old_hi))
+        self._dirty_aabb = (lo, hi)
+        self.invalidate_mesh()
     
     def get_block(self, local_x: int, local_y: int, local_z: int) -> BlockType:
         """
@@ -99,110 +199,97 @@ class Chunk(Entity):
             BlockType at that position, or AIR if out of bounds
         """
         if 0 <= local_x < CHUNK_SIZE and 0 <= local_y < CHUNK_SIZE and 0 <= local_z < CHUNK_SIZE:
-            return self.blocks[local_x][local_y][local_z]
+            return BlockType(int(self.blocks[local_x, local_y, local_z]))
         return BlockType.AIR
     
-    def _get_neighbor_block(self, local_x: int, local_y: int, local_z: int) -> BlockType:
-        """
-        Get block at local position, checking neighbor chunks if out of bounds.
-        
-        This is crucial for correct face culling at chunk boundaries.
+    def _build_padded(self, neighbors: List[Optional['Chunk']]) -> np.ndarray:
         """
-        # Check if within this chunk
-        if 0 <= local_x < CHUNK_SIZE and 0 <= local_y < CHUNK_SIZE and 0 <= local_z < CHUNK_SIZE:
-            return self.blocks[local_x][local_y][local_z]
+        Build an (CHUNK_SIZE+2)^3 copy of the blocks with a one-block border.
         
-        # Calculate which neighbor chunk and position within it
-        neighbor_chunk_offset = (
-            local_x // CHUNK_SIZE if local_x >= CHUNK_SIZE else (local_x // CHUNK_SIZE if local_x < 0 else 0),
-            local_y // CHUNK_SIZE if local_y >= CHUNK_SIZE else (local_y // CHUNK_SIZE if local_y < 0 else 0),
-            local_z // CHUNK_SIZE if local_z >= CHUNK_SIZE else (local_z // CHUNK_SIZE if local_z < 0 else 0),
-        )
+        The border holds the boundary slabs of the 6 neighbor chunks so the
+        mesher can test every neighbor with a plain array index. Edges and
+        corners are never sampled by face culling, so they are left as air.
         
-        neighbor_chunk_pos = (
-            self.chunk_pos[0] + neighbor_chunk_offset[0],
-            self.chunk_pos[1] + neighbor_chunk_offset[1],
-            self.chunk_pos[2] + neighbor_chunk_offset[2],
-        )
-        
-        neighbor_chunk = self.world.get_chunk(neighbor_chunk_pos)
-        if neighbor_chunk is None:
-            return BlockType.AIR  # Treat unloaded chunks as air
+        Args:
+            neighbors: Neighbor chunks in Face order (None = unloaded, treated as air)
+        """
+        size = CHUNK_SIZE
+        padded = np.full((size + 2, size + 2, size + 2), AIR_ID, dtype=np.uint8)
+        padded[1:-1, 1:-1, 1:-1] = self.blocks
         
-        neighbor_local = (
-            local_x % CHUNK_SIZE,
-            local_y % CHUNK_SIZE,
-            local_z % CHUNK_SIZE,
-        )
+        for (border, boundary), neighbor in zip(_BORDER_SLABS, neighbors):
+            if neighbor is not None:
+                padded[border] = neighbor.blocks[boundary]
         
-        return neighbor_chunk.get_block(*neighbor_local)
+        return padded
     
     def generate_mesh(self) -> None:
         """
         Generate the chunk mesh with face culling.
         
-        Only faces adjacent to air blocks are added to the mesh.
-        This dramatically reduces vertex count and draw calls.
+        Only faces adjacent to air blocks are added to the mesh, and
+        coplanar faces of the same block type are greedily merged into
+        larger quads. This dramatically reduces vertex count and draw calls.
+        The per-block work runs in the compiled kernel in mesher.py; without
+        Numba, the vectorized NumPy mesher (no face merging) is used instead.
+        
+        If only a few blocks changed since the last build (see mark_dirty),
+        only the mesh slices through them are rebuilt.
+        
+        This builds on the calling thread; World.request_mesh builds on a
+        worker thread instead.
         """
         if not self._mesh_dirty:
             return
         
-        vertices: List[Tuple[float, float, float]] = []
-        triangles: List[int] = []
-        uvs: List[Tuple[float, float]] = []
+        version, padded, mesh_cache, dirty_aabb = self.prepare_mesh_job()
+        self.apply_mesh(version, build_mesh_arrays(padded, mesh_cache, dirty_aabb))
+    
+    def prepare_mesh_job(self) -> Tuple[int, np.ndarray, Optional[tuple], Optional[tuple]]:
+        """
+        Snapshot everything build_mesh_arrays needs (main thread only).
+        
+        The padded copy decouples the build from later block edits, so the
+        build itself can run on any thread.
         
-        vertex_count = 0
+        Returns:
+            (mesh version, padded blocks, mesh cache, dirty box)
+        """
+        padded = self._build_padded(self.world.get_neighbor_chunks(self.chunk_pos))
+        return self._mesh_version, padded, self._mesh_cache, self._dirty_aabb
+    
+    def apply_mesh(self, version: int, arrays: Tuple[np.ndarray, ...]) -> bool:
+        """
+        Upload mesh arrays from build_mesh_arrays (main thread only).
         
-        # Iterate through all blocks
-        for x in range(CHUNK_SIZE):
-            for y in range(CHUNK_SIZE):
-                for z in range(CHUNK_SIZE):
-                    block_type = self.blocks[x][y][z]
-                    
-                    if block_type == BlockType.AIR:
-                        continue
-                    
-                    # Check each face for visibility
-                    for face in Face:
-                        # Get direction vector for this face
-                        dx, dy, dz = FACE_DIRECTIONS[face]
-                        neighbor_x = x + dx
-                        neighbor_y = y + dy
-                        neighbor_z = z + dz
-                        
-                        # Get neighbor block (handles chunk boundaries)
-                        neighbor_block = self._get_neighbor_block(neighbor_x, neighbor_y, neighbor_z)
-                        
-                        # Only render face if neighbor is air (face is visible)
-                        if neighbor_block == BlockType.AIR:
-                            # Add face vertices
-                            face_verts = FACE_VERTICES[face]
-                            for vx, vy, vz in face_verts:
-                                vertices.append((x + vx, y + vy, z + vz))
-                            
-                            # Add triangle indices (offset by current vertex count)
-                            for idx in QUAD_INDICES:
-                                triangles.append(vertex_count + idx)
-                            
-                            # Add UV coordinates (scaled to atlas position)
-                            u_min, v_min, u_max, v_max = get_block_uvs(block_type, face)
-                            uvs.extend([
-                                (u_min, v_min),
-                                (u_min, v_max),
-                                (u_max, v_max),
-                                (u_max, v_min),
-                            ])
-                            
-                            vertex_count += 4
+        Args:
+            version: Mesh version the arrays were built from
+            arrays: (vertices, triangles, uvs, slice_counts)
         
-        # Create the mesh if we have vertices
-        if vertices:
+        Returns:
+            False if the chunk changed since the build started (arrays discarded)
+        """
+        if version != self._mesh_version:
+            return False
+        
+        vertices, triangles, uvs, slice_counts = arrays
+        self._mesh_cache = (vertices, uvs, slice_counts)
+        self._dirty_aabb = None
+        
+        # Create the mesh if we have vertices. Flat contiguous arrays are
+        # memcpy'd straight into the Panda3D vertex buffers by Mesh, with
+        # no per-vertex Python objects
+        if len(vertices):
             self.model = Mesh(
-                vertices=vertices,
-                triangles=triangles,
-                uvs=uvs,
+                vertices=vertices.ravel(),
+                triangles=triangles.view(np.uint32),
+                uvs=uvs.ravel(),
                 mode='triangle'
             )
+            # Greedy quads carry tile-encoded UVs that need the tiling shader;
+            # per-face quads from the NumPy mesher keep the default shader
+            if NUMBA_AVAILABLE:
+                self.shader = ATLAS_TILING_SHADER
             
             # Load texture atlas
             try:
@@ -213,11 +300,50 @@ class Chunk(Entity):
             self.model = None
         
         self._mesh_dirty = False
+        return True
     
     def rebuild_mesh(self) -> None:
-        """Force a mesh rebuild."""
-        self._mesh_dirty = True
+        """Force a mesh rebuild (of the dirty box if set, else the whole chunk)."""
+        self.invalidate_mesh()
         self.generate_mesh()
+    
+    def invalidate_mesh(self) -> None:
+        """Mark the mesh out of date and discard any build still in flight."""
+        self._mesh_version += 1
+        self._mesh_dirty = True
+
+
+def build_mesh_arrays(padded: np.ndarray, mesh_cache: Optional[tuple],
+                      dirty_aabb: Optional[tuple]) -> Tuple[np.ndarray, ...]:
+    """
+    Mesh a padded chunk snapshot. Pure function, safe to run on worker threads.
+    
+    Small edits only re-mesh the slices crossing the dirty box and splice
+    them into the cached mesh; anything larger re-meshes fully.
+    
+    Returns:
+        (vertices, triangles, uvs, slice_counts)
+    """
+    mesher = greedy_mesh if NUMBA_AVAILABLE else vectorized_mesh
+    
+    # All-air chunks, and solid chunks whose face borders are solid too, have no faces
+    solid = padded[1:-1, 1:-1, 1:-1] != AIR_ID
+    if not solid.any() or (solid.all() and all((padded[border] != AIR_ID).all()
+                                               for border, _ in _BORDER_SLABS)):
+        size = padded.shape[0] - 2
+        return (np.empty((0, 3), dtype=np.float32), np.empty(0, dtype=np.int32),
+                np.empty((0, 2), dtype=np.float32), np.zeros((6, size), dtype=np.int32))
+    
+    if (mesh_cache is not None and dirty_aabb is not None
+            and sum(h - l + 1 for l, h in zip(*dirty_aabb)) <= CHUNK_SIZE):
+        slice_lo, slice_hi = np.array(dirty_aabb[0]), np.array(dirty_aabb[1])
+        vertices, _, uvs, slice_counts = mesher(padded, slice_lo, slice_hi)
+        vertices, uvs, slice_counts = splice_slices(
+            mesh_cache, (vertices, uvs, slice_counts), slice_lo, slice_hi
+        )
+        return vertices, quad_triangles(len(vertices) // 4), uvs, slice_counts
+    
+    return mesher(padded)
 
 
 def world_to_chunk_pos(world_x: int, world_y: int, world_z: int) -> Tuple[int, int, int]:
@@ -225,17 +351,14 @@ def world_to_chunk_pos(world_x: int, world_y: int, world_z: int) -> Tuple[int, i
     Convert world coordinates to chunk coordinates.
     
     Math:
-        chunk_pos = floor(world_pos / CHUNK_SIZE)
+        chunk_pos = floor(world_pos / CHUNK_SIZE) = world_pos >> CHUNK_SHIFT
+        (Python's >> is an arithmetic shift, so this floors negatives too)
         
     Example:
         world (17, 5, -3) with CHUNK_SIZE=16:
         chunk = (1, 0, -1)
     """
-    return (
-        math.floor(world_x / CHUNK_SIZE),
-        math.floor(world_y / CHUNK_SIZE),
-        math.floor(world_z / CHUNK_SIZE),
-    )
+    return (world_x >> CHUNK_SHIFT, world_y >> CHUNK_SHIFT, world_z >> CHUNK_SHIFT)
 
 
 def world_to_local_pos(world_x: int, world_y: int, world_z: int) -> Tuple[int, int, int]:
@@ -243,14 +366,10 @@ def world_to_local_pos(world_x: int, world_y: int, world_z: int) -> Tuple[int, i
     Convert world coordinates to local block coordinates within a chunk.
     
     Math:
-        local_pos = world_pos % CHUNK_SIZE
+        local_pos = world_pos % CHUNK_SIZE = world_pos & CHUNK_MASK
         
     Example:
         world (17, 5, -3) with CHUNK_SIZE=16:
-        local = (1, 5, 13)  # Note: -3 % 16 = 13
+        local = (1, 5, 13)  # Note: -3 & 15 = 13
     """
-    return (
-        world_x % CHUNK_SIZE,
-        world_y % CHUNK_SIZE,
-        world_z % CHUNK_SIZE,
-    )
+    return (world_x & CHUNK_MASK, world_y & CHUNK_MASK, world_z & CHUNK_MASK)
@@ -0,0 +1,22 @@
+"""
+Precompile the Numba kernels into Numba's on-disk cache.
+Run once after installing or updating, so the first game launch does
+not pay the JIT compile time:
+    python compile_caches.py
+"""
+import time
+
+from jit import NUMBA_AVAILABLE
+
+if not NUMBA_AVAILABLE:
+    print("Numba is not installed - the kernels run as plain Python, nothing to compile")
+else:
+    start = time.perf_counter()
+
+    # Kernels with explicit signatures compile (and write the cache) on import
+    import mesher
+    import noise
+    import raycast
+    import terrain
+
+    print(f"Compiled Numba kernels in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,30 @@
+"""
+jit.py - Optional Numba Support
+
+The numeric hot paths (meshing, noise) are written as Numba kernels.
+Numba is optional: when it is not installed, `njit` becomes a no-op
+decorator and `prange` falls back to `range`, so the same kernels
+still run (slowly) as plain Python.
+
+Usage:
+    from jit import njit, prange, NUMBA_AVAILABLE
+
+    @njit(cache=True)
+    def kernel(blocks): ...
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is missing - returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -326,12 +326,15 @@ def main():
     
     input_handler = InputHandler()
     
-    # Game loop entity - handles chunk loading and frustum culling
+    # Game loop entity - handles chunk loading, mesh uploads and frustum culling
     class GameLoop(Entity):
         def update(self):
             # Update chunk loading based on player position
             world.load_chunks_around(player.position.x, player.position.y, player.position.z)
             
+            # Upload chunk meshes built by the worker threads
+            world.upload_finished_meshes()
+            
             # Update frustum culling
             world.update_frustum_culling()
     
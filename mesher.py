@@ -0,0 +1,404 @@
+"""
+mesher.py - Compiled Chunk Meshing Kernels
+
+Turns a chunk's block IDs into vertex, triangle and UV arrays.
+
+Input is a "padded" block array of shape (CHUNK_SIZE+2)^3: the chunk's
+own blocks sit in padded[1:-1, 1:-1, 1:-1] and the one-block border
+holds the neighbouring chunks' boundary blocks. This lets the kernel
+check any neighbour with a plain array index, with no chunk-boundary
+special cases.
+
+Output buffers are preallocated for the worst case (every face of every
+block visible) and the kernels return how many vertices they wrote.
+The kernels release the GIL, so chunks can be meshed on worker threads. The
+buffers are per-thread scratch space reused by every rebuild; the
+wrappers return copies of the written part.
+
+The chunk meshers (greedy and vectorized) emit quads ordered by face,
+then by slice along that face's axis, and report how many quads each
+(face, slice) plane produced. A block edit only changes the planes
+around it, so those can be re-meshed on their own and spliced into the
+previous mesh with splice_slices().
+
+Two meshers are provided:
+    greedy_mesh_chunk: binary greedy meshing - visible faces are packed
+                       into bit rows and merged into the largest
+                       rectangles of identical block type, so a flat
+                       16x16 slab becomes 1 quad instead of 256
+    vectorized_mesh:   one quad per visible block face, plain atlas UVs,
+                       computed with whole-array NumPy operations; used
+                       when Numba is not installed and the kernel would
+                       run as Python
+
+Greedy quads span several blocks, so their UVs cannot point straight
+into the atlas. Instead U encodes the atlas tile plus a repeat
+coordinate, and the chunk shader wraps it back into the tile:
+    u = tile * TILE_UV_STRIDE + TILE_UV_MARGIN + local_u    (local_u in 0..w)
+    v = local_v                                              (local_v in 0..h)
+"""
+
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+from jit import njit
+from voxel import (
+    BlockType, Face, AIR_ID, FACE_DIRECTIONS, FACE_VERTICES, FACE_UVS,
+    BLOCK_TEXTURES, UV_TABLE,
+    FACE_DIRECTIONS_ARR, FACE_VERTICES_ARR, FACE_UVS_ARR, QUAD_INDICES_ARR
+)
+
+# Face direction vectors, indexed by Face value: (6, 3)
+FACE_DIRS = FACE_DIRECTIONS_ARR
+
+# Axis (x=0, y=1, z=2) each face points along: (6,)
+FACE_AXES = np.abs(FACE_DIRS).argmax(axis=1)
+
+# Atlas tile index per block type and face: (n_types, 6)
+FACE_TILES = np.array(
+    [[BLOCK_TEXTURES.get(block_type, {}).get(face, 0) for face in Face] for block_type in BlockType],
+    dtype=np.int32
+)
+
+
+def _uv_axis(face: Face, uv: int) -> int:
+    """Find the axis (x=0, y=1, z=2) that texture coordinate `uv` runs along on a face."""
+    for axis in range(3):
+        coords = [vertex[axis] for vertex in FACE_VERTICES[face]]
+        tex = [corner[uv] for corner in FACE_UVS]
+        if coords == tex or coords == [1 - t for t in tex]:
+            return axis
+    raise ValueError(f"No axis matches UV {uv} on face {face!r}")
+
+
+# Which axis the U and V texture coordinates run along per face: (6, 2)
+FACE_UV_AXES = np.array(
+    [[_uv_axis(face, 0), _uv_axis(face, 1)] for face in Face],
+    dtype=np.int8
+)
+
+# Greedy UV encoding (see module docstring). The stride leaves room for
+# quads up to CHUNK_SIZE wide; the margin keeps interpolated values from
+# dipping into the previous tile.
+TILE_UV_STRIDE = 32.0
+TILE_UV_MARGIN = 8.0
+
+AIR = AIR_ID
+
+# Kernel signatures. Declaring them compiles the kernels eagerly at import
+# (or loads them from Numba's disk cache) instead of on the first rebuild.
+# Argument layouts must match the tables above and _allocate_buffers.
+GREEDY_MESH_SIGNATURE = (
+    'i8(u1[:, :, ::1], i1[:, ::1], f4[:, :, ::1], f4[:, ::1], i4[:, ::1], i1[:, ::1], '
+    'i4[::1], i8[::1], i8[::1], f4[:, ::1], i4[::1], f4[:, ::1], i4[:, ::1])'
+)
+
+
+@njit('i8(i8)', cache=True, inline='always')
+def _trailing_zeros(mask):
+    """Index of the lowest set bit of a non-zero mask."""
+    count = 0
+    while (mask & 1) == 0:
+        mask >>= 1
+        count += 1
+    return count
+
+
+@njit(GREEDY_MESH_SIGNATURE, cache=True, nogil=True)
+def greedy_mesh_chunk(padded, face_dirs, face_verts, face_uvs, face_tiles, face_uv_axes,
+                      quad_indices, slice_lo, slice_hi,
+                      verts_out, tris_out, uvs_out, slice_counts_out):
+    """
+    Binary greedy mesher.
+
+    For each axis, every column of blocks along that axis is packed into
+    an int64 occupancy mask (bit i = padded block i is solid); all three
+    axes are packed in a single linear pass over the padded array. Visible
+    faces fall out of one shift and AND:
+        positive face: occ & ~(occ >> 1)
+        negative face: occ & ~(occ << 1)
+
+    The face bits are then regrouped into per-slice, per-block-type
+    planes of bit rows, and each plane is merged greedily: take the
+    lowest set bit of a row, extend the run while bits stay set, then
+    extend downwards while the next rows contain the whole run.
+
+    Args:
+        padded: (S+2, S+2, S+2) uint8 block IDs with neighbour border
+        face_dirs, face_verts, face_uvs, face_tiles, face_uv_axes, quad_indices: lookup tables
+        slice_lo, slice_hi: (3,) inclusive slice range to mesh along each axis
+        verts_out, tris_out, uvs_out: preallocated output buffers
+        slice_counts_out: (6, S) quads emitted per (face, slice)
+
+    Returns:
+        Number of vertices written
+    """
+    size = padded.shape[0] - 2
+    n_types = face_tiles.shape[0]
+
+    columns = np.zeros((3, size, size), dtype=np.int64)
+    planes = np.zeros((size, n_types, size), dtype=np.int64)
+    pos = np.zeros(3, dtype=np.int64)
+    extent = np.ones(3, dtype=np.int64)
+
+    n_verts = 0
+    n_tris = 0
+
+    # Pack every column along each axis into a bitmask, in one pass over
+    # padded in memory order. columns[axis, u, v] follows the (u, v) axis
+    # order used below; border cells only contribute along their own axis.
+    for x in range(size + 2):
+        x_inner = 1 <= x <= size
+        for y in range(size + 2):
+            y_inner = 1 <= y <= size
+            for z in range(size + 2):
+                if padded[x, y, z] == AIR:
+                    continue
+                z_inner = 1 <= z <= size
+                if y_inner and z_inner:
+                    columns[0, y - 1, z - 1] |= 1 << x
+                if x_inner and z_inner:
+                    columns[1, x - 1, z - 1] |= 1 << y
+                if x_inner and y_inner:
+                    columns[2, x - 1, y - 1] |= 1 << z
+
+    for face in range(6):
+        # Axis this face points along, and the two axes spanning its plane
+        axis = 0
+        while face_dirs[face, axis] == 0:
+            axis += 1
+        sign = face_dirs[face, axis]
+        u_axis = 1 if axis == 0 else 0
+        v_axis = 1 if axis == 2 else 2
+
+        # Bits of the requested slices (padded index = slice + 1)
+        lo = slice_lo[axis]
+        hi = slice_hi[axis]
+        interior = ((1 << (hi - lo + 1)) - 1) << (lo + 1)
+
+        # Scatter visible face bits into per-slice, per-type planes
+        planes[:, :, :] = 0
+        for u in range(size):
+            for v in range(size):
+                column = columns[axis, u, v]
+                if sign > 0:
+                    visible = column & ~(column >> 1) & interior
+                else:
+                    visible = column & ~(column << 1) & interior
+                while visible != 0:
+                    i = _trailing_zeros(visible)
+                    visible &= visible - 1
+                    pos[axis] = i
+                    pos[u_axis] = u + 1
+                    pos[v_axis] = v + 1
+                    block = padded[pos[0], pos[1], pos[2]]
+                    planes[i - 1, block, u] |= 1 << v
+
+        # Greedily merge each plane into rectangles
+        for s in range(lo, hi + 1):
+            slice_start = n_verts
+            for block in range(1, n_types):
+                for u in range(size):
+                    row = planes[s, block, u]
+                    while row != 0:
+                        v0 = _trailing_zeros(row)
+                        width = _trailing_zeros(~(row >> v0))
+                        run = ((1 << width) - 1) << v0
+                        row &= ~run
+
+                        height = 1
+                        while u + height < size and (planes[s, block, u + height] & run) == run:
+                            planes[s, block, u + height] &= ~run
+                            height += 1
+
+                        # Emit one quad covering the merged rectangle
+                        pos[axis] = s
+                        pos[u_axis] = u
+                        pos[v_axis] = v0
+                        extent[axis] = 1
+                        extent[u_axis] = height
+                        extent[v_axis] = width
+
+                        for i in range(4):
+                            for c in range(3):
+                                verts_out[n_verts + i, c] = face_verts[face, i, c] * extent[c] + pos[c]
+
+                        for i in range(6):
+                            tris_out[n_tris + i] = quad_indices[i] + n_verts
+
+                        scale_u = extent[face_uv_axes[face, 0]]
+                        scale_v = extent[face_uv_axes[face, 1]]
+                        tile_u = face_tiles[block, face] * TILE_UV_STRIDE + TILE_UV_MARGIN
+                        for i in range(4):
+                            uvs_out[n_verts + i, 0] = face_uvs[i, 0] * scale_u + tile_u
+                            uvs_out[n_verts + i, 1] = face_uvs[i, 1] * scale_v
+
+                        n_verts += 4
+                        n_tris += 6
+
+            slice_counts_out[face, s] = (n_verts - slice_start) // 4
+
+    return n_verts
+
+
+def _allocate_buffers(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Allocate worst-case vertex, triangle and UV buffers for one chunk."""
+    max_verts = size * size * size * 6 * 4
+    verts = np.empty((max_verts, 3), dtype=np.float32)
+    tris = np.empty(max_verts * 6 // 4, dtype=np.int32)
+    uvs = np.empty((max_verts, 2), dtype=np.float32)
+    return verts, tris, uvs
+
+
+# Worst-case output buffers, one set per thread so concurrent rebuilds
+# never share them
+_scratch = threading.local()
+
+
+def _scratch_buffers(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get this thread's reusable output buffers for chunks of the given size."""
+    buffers = getattr(_scratch, 'buffers', None)
+    if buffers is None or len(buffers[0]) != size * size * size * 6 * 4:
+        buffers = _allocate_buffers(size)
+        _scratch.buffers = buffers
+    return buffers
+
+
+def vectorized_mesh(padded: np.ndarray, slice_lo: Optional[np.ndarray] = None,
+                    slice_hi: Optional[np.ndarray] = None
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build per-face mesh arrays (plain atlas UVs) with NumPy array operations.
+
+    Face culling is one slice comparison per face direction, e.g. for +X:
+        (padded[1:-1, 1:-1, 1:-1] != AIR) & (padded[2:, 1:-1, 1:-1] == AIR)
+
+    Args:
+        padded: (S+2, S+2, S+2) uint8 block IDs with neighbour border
+        slice_lo, slice_hi: optional (3,) inclusive slice range per axis (default: all)
+
+    Returns:
+        (vertices (N, 3) float32, triangles (N*6/4,) int32, uvs (N, 2) float32,
+         slice_counts (6, S) int32)
+    """
+    size = padded.shape[0] - 2
+    slice_lo, slice_hi = _slice_range(size, slice_lo, slice_hi)
+    inner = padded[1:-1, 1:-1, 1:-1]
+    solid = inner != AIR
+    slice_counts = np.zeros((6, size), dtype=np.int32)
+
+    vert_parts = []
+    uv_parts = []
+    for face in Face:
+        dx, dy, dz = FACE_DIRECTIONS[face]
+        axis = FACE_AXES[face]
+        neighbor = padded[1 + dx:size + 1 + dx, 1 + dy:size + 1 + dy, 1 + dz:size + 1 + dz]
+        visible = solid & (neighbor == AIR)
+
+        # Put the face axis first so argwhere returns positions sorted by slice
+        visible = np.moveaxis(visible, axis, 0)[slice_lo[axis]:slice_hi[axis] + 1]
+        found = np.argwhere(visible)
+        if len(found) == 0:
+            continue
+        found[:, 0] += slice_lo[axis]
+
+        coords = np.empty_like(found)   # (N, 3) block positions
+        coords[:, axis] = found[:, 0]
+        coords[:, [a for a in range(3) if a != axis]] = found[:, 1:]
+
+        vert_parts.append((coords[:, None, :] + FACE_VERTICES_ARR[face]).reshape(-1, 3))
+        uv_parts.append(UV_TABLE[inner[coords[:, 0], coords[:, 1], coords[:, 2]], face].reshape(-1, 2))
+        slice_counts[face] = np.bincount(found[:, 0], minlength=size)
+
+    if not vert_parts:
+        return (np.empty((0, 3), dtype=np.float32), np.empty(0, dtype=np.int32),
+                np.empty((0, 2), dtype=np.float32), slice_counts)
+
+    verts = np.concatenate(vert_parts).astype(np.float32)
+    uvs = np.concatenate(uv_parts)
+
+    return verts, quad_triangles(len(verts) // 4), uvs, slice_counts
+
+
+def greedy_mesh(padded: np.ndarray, slice_lo: Optional[np.ndarray] = None,
+                slice_hi: Optional[np.ndarray] = None
+                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build greedy-merged mesh arrays (tile-encoded UVs) for a padded chunk.
+
+    Args:
+        padded: (S+2, S+2, S+2) uint8 block IDs with neighbour border
+        slice_lo, slice_hi: optional (3,) inclusive slice range per axis (default: all)
+
+    Returns:
+        (vertices (N, 3) float32, triangles (N*6/4,) int32, uvs (N, 2) float32,
+         slice_counts (6, S) int32)
+    """
+    size = padded.shape[0] - 2
+    slice_lo, slice_hi = _slice_range(size, slice_lo, slice_hi)
+    verts, tris, uvs = _scratch_buffers(size)
+    slice_counts = np.zeros((6, size), dtype=np.int32)
+
+    n_verts = greedy_mesh_chunk(padded, FACE_DIRS, FACE_VERTICES_ARR, FACE_UVS_ARR,
+                                FACE_TILES, FACE_UV_AXES, QUAD_INDICES_ARR, slice_lo, slice_hi,
+                                verts, tris, uvs, slice_counts)
+
+    # Copy out: the scratch buffers are overwritten by the next rebuild
+    return (verts[:n_verts].copy(), tris[:n_verts * 6 // 4].copy(), uvs[:n_verts].copy(),
+            slice_counts)
+
+
+def _slice_range(size: int, slice_lo: Optional[np.ndarray],
+                 slice_hi: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Default a missing slice range to the whole chunk."""
+    if slice_lo is None:
+        slice_lo = np.zeros(3, dtype=np.int64)
+    if slice_hi is None:
+        slice_hi = np.full(3, size - 1, dtype=np.int64)
+    return np.asarray(slice_lo, dtype=np.int64), np.asarray(slice_hi, dtype=np.int64)
+
+
+def quad_triangles(n_quads: int) -> np.ndarray:
+    """Triangle indices for n_quads consecutive 4-vertex quads."""
+    return (np.arange(n_quads, dtype=np.int32)[:, None] * 4 + QUAD_INDICES_ARR).ravel()
+
+
+def splice_slices(old: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                  new: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                  slice_lo: np.ndarray, slice_hi: np.ndarray
+                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Replace the re-meshed slices of a previous mesh with new ones.
+
+    Args:
+        old: (vertices, uvs, slice_counts) of the previous full mesh
+        new: (vertices, uvs, slice_counts) meshed only for [slice_lo, slice_hi]
+        slice_lo, slice_hi: (3,) inclusive slice range that was re-meshed
+
+    Returns:
+        Merged (vertices, uvs, slice_counts), still ordered by (face, slice)
+    """
+    old_verts, old_uvs, old_counts = old
+    new_verts, new_uvs, new_counts = new
+    size = old_counts.shape[1]
+
+    slices = np.arange(size)
+    face_lo = np.asarray(slice_lo)[FACE_AXES][:, None]
+    face_hi = np.asarray(slice_hi)[FACE_AXES][:, None]
+    rebuilt = (slices >= face_lo) & (slices <= face_hi)     # (6, S)
+
+    # Label every quad with its (face, slice) plane, drop the stale ones,
+    # and stable-sort old and new quads back into plane order
+    planes = np.arange(6 * size)
+    old_labels = np.repeat(planes, old_counts.ravel())
+    keep = ~rebuilt.ravel()[old_labels]
+    new_labels = np.repeat(planes, new_counts.ravel())
+    order = np.argsort(np.concatenate([old_labels[keep], new_labels]), kind='stable')
+
+    verts = np.concatenate([old_verts.reshape(-1, 4, 3)[keep], new_verts.reshape(-1, 4, 3)])
+    uvs = np.concatenate([old_uvs.reshape(-1, 4, 2)[keep], new_uvs.reshape(-1, 4, 2)])
+    counts = np.where(rebuilt, new_counts, old_counts)
+
+    return verts[order].reshape(-1, 3), uvs[order].reshape(-1, 2), counts
@@ -4,31 +4,44 @@ noise.py - Perlin Noise Implementation for Terrain Generation
 This module implements a simple 2D Perlin noise algorithm used for
 procedural terrain height generation. The noise function returns
 smooth, continuous values that create natural-looking terrain.
+
+The noise functions are Numba kernels (see jit.py). Numba freezes
+module globals at compile time, so the kernels take the permutation
+and gradient tables as arguments; the public wrappers pass in the
+current tables. Without Numba, whole heightmaps are computed by the
+vectorized *_grid functions instead, which evaluate the same formulas
+on NumPy arrays.
 """
 
 import math
 import random
-from typing import List, Tuple
+
+import numpy as np
+
+from jit import njit, NUMBA_AVAILABLE
 
 # Permutation table for gradient hashing
 # This is shuffled once at startup to ensure consistent terrain
-PERMUTATION: List[int] = []
+PERMUTATION: np.ndarray = np.empty(0, dtype=np.int32)
 
 def init_permutation(seed: int = 42) -> None:
     """Initialize the permutation table with a given seed for reproducibility."""
     global PERMUTATION
     random.seed(seed)
-    PERMUTATION = list(range(256))
-    random.shuffle(PERMUTATION)
+    perm = list(range(256))
+    random.shuffle(perm)
     # Duplicate the permutation table to avoid overflow handling
-    PERMUTATION = PERMUTATION + PERMUTATION
+    PERMUTATION = np.asarray(perm + perm, dtype=np.int32)
 
-# Gradient vectors for 2D Perlin noise
-GRADIENTS_2D: List[Tuple[float, float]] = [
+# Gradient vectors for 2D Perlin noise: (8, 2)
+# The count must stay a power of two so indices can be masked instead of taken modulo
+GRADIENTS_2D: np.ndarray = np.asarray([
     (1, 0), (-1, 0), (0, 1), (0, -1),
     (1, 1), (-1, 1), (1, -1), (-1, -1)
-]
+], dtype=np.float32)
+GRADIENT_MASK = len(GRADIENTS_2D) - 1
 
+@njit(cache=True, fastmath=True, inline='always')
 def _fade(t: float) -> float:
     """
     Fade function for smooth interpolation.
@@ -37,15 +50,20 @@ def _fade(t: float) -> float:
     """
     return t * t * t * (t * (t * 6 - 15) + 10)
 
+@njit(cache=True, fastmath=True, inline='always')
 def _lerp(a: float, b: float, t: float) -> float:
     """Linear interpolation between a and b by factor t."""
     return a + t * (b - a)
 
-def _dot_grid_gradient(ix: int, iy: int, x: float, y: float) -> float:
+@njit('f8(i4[::1], f4[:, ::1], i8, i8, f8, f8)', cache=True, fastmath=True, inline='always')
+def _dot_grid_gradient(perm: np.ndarray, gradients: np.ndarray,
+                       ix: int, iy: int, x: float, y: float) -> float:
     """
     Compute the dot product of the distance and gradient vectors.
     
     Args:
+        perm: Permutation table (512,)
+        gradients: Gradient table (8, 2)
         ix, iy: Integer grid coordinates
         x, y: Point coordinates
     
@@ -53,26 +71,18 @@ def _dot_grid_gradient(ix: int, iy: int, x: float, y: float) -> float:
         Dot product contribution from this grid corner
     """
     # Get gradient index from permutation table
-    gradient_index = PERMUTATION[(ix + PERMUTATION[iy & 255]) & 255] % len(GRADIENTS_2D)
-    gradient = GRADIENTS_2D[gradient_index]
+    gradient_index = perm[(ix + perm[iy & 255]) & 255] & GRADIENT_MASK
     
     # Distance vector from grid point to input point
     dx = x - ix
     dy = y - iy
     
     # Dot product
-    return dx * gradient[0] + dy * gradient[1]
+    return dx * gradients[gradient_index, 0] + dy * gradients[gradient_index, 1]
 
-def perlin_2d(x: float, y: float) -> float:
-    """
-    Generate 2D Perlin noise at the given coordinates.
-    
-    Args:
-        x, y: World coordinates (can be any float value)
-    
-    Returns:
-        Noise value in range approximately [-1, 1]
-    """
+@njit('f8(i4[::1], f4[:, ::1], f8, f8)', cache=True, fastmath=True)
+def _perlin_2d(perm: np.ndarray, gradients: np.ndarray, x: float, y: float) -> float:
+    """Perlin noise kernel, see perlin_2d."""
     # Determine grid cell coordinates
     x0 = int(math.floor(x))
     y0 = int(math.floor(y))
@@ -85,18 +95,59 @@ def perlin_2d(x: float, y: float) -> float:
     
     # Interpolate between grid point gradients
     # Bottom edge
-    n0 = _dot_grid_gradient(x0, y0, x, y)
-    n1 = _dot_grid_gradient(x1, y0, x, y)
+    n0 = _dot_grid_gradient(perm, gradients, x0, y0, x, y)
+    n1 = _dot_grid_gradient(perm, gradients, x1, y0, x, y)
     ix0 = _lerp(n0, n1, sx)
     
     # Top edge
-    n0 = _dot_grid_gradient(x0, y1, x, y)
-    n1 = _dot_grid_gradient(x1, y1, x, y)
+    n0 = _dot_grid_gradient(perm, gradients, x0, y1, x, y)
+    n1 = _dot_grid_gradient(perm, gradients, x1, y1, x, y)
     ix1 = _lerp(n0, n1, sx)
     
     # Final interpolation
     return _lerp(ix0, ix1, sy)
 
+@njit('f8(i4[::1], f4[:, ::1], f8, f8, i8, f8, f8)', cache=True, fastmath=True)
+def _octave_perlin(perm: np.ndarray, gradients: np.ndarray, x: float, y: float,
+                   octaves: int, persistence: float, scale: float) -> float:
+    """Multi-octave noise kernel, see octave_perlin."""
+    total = 0.0
+    frequency = scale
+    amplitude = 1.0
+    max_value = 0.0  # Used for normalizing
+    
+    for _ in range(octaves):
+        total += _perlin_2d(perm, gradients, x * frequency, y * frequency) * amplitude
+        max_value += amplitude
+        amplitude *= persistence
+        frequency *= 2  # Each octave doubles the frequency
+    
+    # Normalize to [0, 1] range
+    return (total / max_value + 1) / 2
+
+@njit('i4[:, ::1](i4[::1], f4[:, ::1], i8, i8, i8, i8, i8, i8)', cache=True, nogil=True)
+def _heightmap(perm: np.ndarray, gradients: np.ndarray, x0: int, z0: int,
+               width: int, depth: int, base_height: int, height_scale: int) -> np.ndarray:
+    """Terrain height kernel, see heightmap_block."""
+    heights = np.empty((width, depth), dtype=np.int32)
+    for i in range(width):
+        for j in range(depth):
+            noise_value = _octave_perlin(perm, gradients, x0 + i, z0 + j, 4, 0.5, 0.02)
+            heights[i, j] = base_height + int(noise_value * height_scale)
+    return heights
+
+def perlin_2d(x: float, y: float) -> float:
+    """
+    Generate 2D Perlin noise at the given coordinates.
+    
+    Args:
+        x, y: World coordinates (can be any float value)
+    
+    Returns:
+        Noise value in range approximately [-1, 1]
+    """
+    return _perlin_2d(PERMUTATION, GRADIENTS_2D, x, y)
+
 def octave_perlin(x: float, y: float, octaves: int = 4, 
                   persistence: float = 0.5, scale: float = 0.02) -> float:
     """
@@ -114,19 +165,7 @@ def octave_perlin(x: float, y: float, octaves: int = 4,
     Returns:
         Combined noise value, normalized to approximately [0, 1]
     """
-    total = 0.0
-    frequency = scale
-    amplitude = 1.0
-    max_value = 0.0  # Used for normalizing
-    
-    for _ in range(octaves):
-        total += perlin_2d(x * frequency, y * frequency) * amplitude
-        max_value += amplitude
-        amplitude *= persistence
-        frequency *= 2  # Each octave doubles the frequency
-    
-    # Normalize to [0, 1] range
-    return (total / max_value + 1) / 2
+    return _octave_perlin(PERMUTATION, GRADIENTS_2D, x, y, octaves, persistence, scale)
 
 def get_terrain_height(world_x: int, world_z: int, 
                        base_height: int = 32, 
@@ -152,5 +191,97 @@ def get_terrain_height(world_x: int, world_z: int,
     noise_value = octave_perlin(world_x, world_z)
     return base_height + int(noise_value * height_scale)
 
+def perlin_2d_grid(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Generate 2D Perlin noise for every point of a grid at once.
+    
+    Args:
+        xs: (W,) X coordinates
+        ys: (H,) Y coordinates
+    
+    Returns:
+        (W, H) noise values, grid[i, j] = perlin_2d(xs[i], ys[j])
+    """
+    x, y = np.meshgrid(np.asarray(xs, dtype=np.float64),
+                       np.asarray(ys, dtype=np.float64), indexing='ij')
+    
+    # Grid cell coordinates and fade weights
+    x0 = np.floor(x).astype(np.int64)
+    y0 = np.floor(y).astype(np.int64)
+    x1 = x0 + 1
+    y1 = y0 + 1
+    sx = _fade(x - x0)
+    sy = _fade(y - y0)
+    
+    def dot_grid_gradient(ix, iy):
+        gradient_index = PERMUTATION[(ix + PERMUTATION[iy & 255]) & 255] & GRADIENT_MASK
+        gradient = GRADIENTS_2D[gradient_index]
+        return (x - ix) * gradient[..., 0] + (y - iy) * gradient[..., 1]
+    
+    ix0 = _lerp(dot_grid_gradient(x0, y0), dot_grid_gradient(x1, y0), sx)
+    ix1 = _lerp(dot_grid_gradient(x0, y1), dot_grid_gradient(x1, y1), sx)
+    return _lerp(ix0, ix1, sy)
+
+def octave_perlin_grid(xs: np.ndarray, ys: np.ndarray, octaves: int = 4,
+                       persistence: float = 0.5, scale: float = 0.02) -> np.ndarray:
+    """
+    Generate multi-octave Perlin noise for every point of a grid at once.
+    
+    Args:
+        xs: (W,) X coordinates
+        ys: (H,) Y coordinates
+        octaves, persistence, scale: As for octave_perlin
+    
+    Returns:
+        (W, H) noise values normalized to approximately [0, 1]
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    total = np.zeros((len(xs), len(ys)))
+    frequency = scale
+    amplitude = 1.0
+    max_value = 0.0
+    
+    for _ in range(octaves):
+        total += perlin_2d_grid(xs * frequency, ys * frequency) * amplitude
+        max_value += amplitude
+        amplitude *= persistence
+        frequency *= 2
+    
+    return (total / max_value + 1) / 2
+
+def get_terrain_heights(x0: int, z0: int, width: int, depth: int,
+                        base_height: int = 32, height_scale: int = 16) -> np.ndarray:
+    """
+    Get terrain heights for a rectangle of columns with NumPy array operations.
+    
+    Returns:
+        (width, depth) int32 array, heights[i, j] = get_terrain_height(x0 + i, z0 + j)
+    """
+    noise_values = octave_perlin_grid(np.arange(x0, x0 + width), np.arange(z0, z0 + depth))
+    # Truncate toward zero like int() does
+    return base_height + np.trunc(noise_values * height_scale).astype(np.int32)
+
+def heightmap_block(x0: int, z0: int, width: int, depth: int,
+                    base_height: int = 32, height_scale: int = 16) -> np.ndarray:
+    """
+    Get terrain heights for a whole rectangle of columns in one call.
+    
+    The compiled kernel runs serially and releases the GIL, so chunk
+    generation workers can each call it for their own chunk at once.
+    
+    Args:
+        x0, z0: World X, Z of the first column
+        width, depth: Number of columns along X and Z
+        base_height, height_scale: As for get_terrain_height
+    
+    Returns:
+        (width, depth) int32 array, heights[i, j] = get_terrain_height(x0 + i, z0 + j)
+    """
+    if not NUMBA_AVAILABLE:
+        return get_terrain_heights(x0, z0, width, depth, base_height, height_scale)
+    return _heightmap(PERMUTATION, GRADIENTS_2D, x0, z0, width, depth,
+                      base_height, height_scale)
+
 # Initialize permutation table on module load
 init_permutation()
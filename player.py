@@ -20,9 +20,10 @@ from ursina import (
     raycast, color, destroy, BoxCollider
 )
 from ursina.prefabs.first_person_controller import FirstPersonController
+from typing import Optional, Tuple
 import math
 
-from voxel import BlockType
+from voxel import BlockType, AIR_ID
 from world import World
 
 
@@ -50,6 +51,30 @@ class Player(Entity):
         self.height = 1.8
         self.width = 0.6
         
+        # Collision sample points relative to the player's feet
+        # Use smaller collision width to prevent edge sticking
+        half_width = 0.2  # Smaller than visual to prevent getting stuck
+        # Avoid feet level for sides (causes edge sticking)
+        self._collision_offsets = (
+            # Center column only at ground level
+            (0, 0.1, 0),
+            (0, 0.5, 0),
+            # Body level - check sides
+            (half_width, 0.7, 0),
+            (-half_width, 0.7, 0),
+            (0, 0.7, half_width),
+            (0, 0.7, -half_width),
+            # Upper body
+            (half_width, 1.3, 0),
+            (-half_width, 1.3, 0),
+            (0, 1.3, half_width),
+            (0, 1.3, -half_width),
+            # Head level
+            (0, self.height - 0.05, 0),
+        )
+        # Body center points used to detect being stuck inside a block
+        self._unstick_offsets = ((0, 0.1, 0), (0, 0.5, 0), (0, 1.0, 0))
+        
         # Camera setup
         camera.parent = self
         camera.position = Vec3(0, 1.6, 0)  # Eye height
@@ -124,22 +149,18 @@ class Player(Entity):
     def _unstick_from_blocks(self):
         """Push player up if they're stuck inside a block."""
         # Check body center positions
-        for check_y in [0.1, 0.5, 1.0]:
-            block = self.world.get_block(
-                int(math.floor(self.position.x)),
-                int(math.floor(self.position.y + check_y)),
-                int(math.floor(self.position.z))
+        position = self.position
+        stuck = self._first_solid_offset(position.x, position.y, position.z, self._unstick_offsets)
+        
+        if stuck is not None:
+            # Player's center is inside a block - push them up
+            check_y = stuck[1]
+            self.position = Vec3(
+                position.x,
+                math.floor(position.y + check_y) + 1.01,
+                position.z
             )
-            
-            if block != BlockType.AIR:
-                # Player's center is inside a block - push them up
-                self.position = Vec3(
-                    self.position.x,
-                    math.floor(self.position.y + check_y) + 1.01,
-                    self.position.z
-                )
-                self.velocity_y = 0
-                return
+            self.velocity_y = 0
     
     def _handle_mouse_look(self):
         """Handle mouse movement for camera rotation."""
@@ -158,109 +179,85 @@ class Player(Entity):
     def _handle_movement(self):
         """Handle WASD movement with collision."""
         # Get input direction
-        move_direction = Vec3(
-            held_keys['d'] - held_keys['a'],
-            0,
-            held_keys['w'] - held_keys['s']
-        )
+        move_x = held_keys['d'] - held_keys['a']
+        move_z = held_keys['w'] - held_keys['s']
         
-        if move_direction.length() == 0:
+        if move_x == 0 and move_z == 0:
             return
         
-        # Normalize and apply speed
-        move_direction = move_direction.normalized()
-        
         # Convert to world space based on player rotation
-        forward = Vec3(
-            math.sin(math.radians(self.rotation_y)),
-            0,
-            math.cos(math.radians(self.rotation_y))
-        )
-        right = Vec3(
-            math.sin(math.radians(self.rotation_y + 90)),
-            0,
-            math.cos(math.radians(self.rotation_y + 90))
-        )
+        # forward = (sin r, cos r), right = forward rotated by 90 degrees = (cos r, -sin r)
+        yaw = math.radians(self.rotation_y)
+        sin_y = math.sin(yaw)
+        cos_y = math.cos(yaw)
+        direction_x = sin_y * move_z + cos_y * move_x
+        direction_z = cos_y * move_z - sin_y * move_x
+        
+        # Normalize and apply speed
+        step = self.speed * time.dt / math.hypot(direction_x, direction_z)
+        velocity_x = direction_x * step
+        velocity_z = direction_z * step
         
-        world_direction = (forward * move_direction.z + right * move_direction.x).normalized()
-        velocity = world_direction * self.speed * time.dt
+        # Physics runs on scalar locals; a Vec3 is only built to write back
+        position = self.position
+        x, y, z = position.x, position.y, position.z
         
         # Axis-separated collision for smooth sliding along walls
         moved_x = False
         moved_z = False
         
         # Try X movement
-        new_pos_x = Vec3(self.position.x + velocity.x, self.position.y, self.position.z)
-        if not self._check_collision(new_pos_x):
-            self.position = new_pos_x
+        if not self._check_collision(x + velocity_x, y, z):
+            x += velocity_x
             moved_x = True
         
         # Try Z movement
-        new_pos_z = Vec3(self.position.x, self.position.y, self.position.z + velocity.z)
-        if not self._check_collision(new_pos_z):
-            self.position = new_pos_z
+        if not self._check_collision(x, y, z + velocity_z):
+            z += velocity_z
             moved_z = True
         
         # If stuck (couldn't move at all while trying to move), try pushing up
         # But only if not on cooldown to prevent bouncing
-        if not moved_x and not moved_z and self.grounded and self._stuck_cooldown <= 0:
-            # Try moving up slightly to escape stuck position
-            up_pos = Vec3(self.position.x, self.position.y + 0.5, self.position.z)
-            if not self._check_collision(up_pos):
-                self.position = up_pos
-                self._stuck_cooldown = 0.5  # Wait before pushing again
+        if not moved_x and not moved_z:
+            if self.grounded and self._stuck_cooldown <= 0:
+                # Try moving up slightly to escape stuck position
+                if not self._check_collision(x, y + 0.5, z):
+                    self.position = Vec3(x, y + 0.5, z)
+                    self._stuck_cooldown = 0.5  # Wait before pushing again
+            return
+        
+        self.position = Vec3(x, y, z)
     
-    def _check_collision(self, new_pos: Vec3) -> bool:
+    def _check_collision(self, x: float, y: float, z: float) -> bool:
         """
-        Check if the new position would collide with terrain.
+        Check if the player standing at (x, y, z) would collide with terrain.
         
         Samples multiple points around the player's hitbox.
         """
-        # Use smaller collision width to prevent edge sticking
-        half_width = 0.2  # Smaller than visual to prevent getting stuck
-        
-        # Check points - avoid feet level for sides (causes edge sticking)
-        check_offsets = [
-            # Center column only at ground level
-            Vec3(0, 0.1, 0),
-            Vec3(0, 0.5, 0),
-            # Body level - check sides
-            Vec3(half_width, 0.7, 0),
-            Vec3(-half_width, 0.7, 0),
-            Vec3(0, 0.7, half_width),
-            Vec3(0, 0.7, -half_width),
-            # Upper body
-            Vec3(half_width, 1.3, 0),
-            Vec3(-half_width, 1.3, 0),
-            Vec3(0, 1.3, half_width),
-            Vec3(0, 1.3, -half_width),
-            # Head level
-            Vec3(0, self.height - 0.05, 0),
-        ]
-        
-        for offset in check_offsets:
-            check_pos = new_pos + offset
-            block = self.world.get_block(
-                int(math.floor(check_pos.x)),
-                int(math.floor(check_pos.y)),
-                int(math.floor(check_pos.z))
-            )
-            if block != BlockType.AIR:
-                return True
-        
-        return False
+        return self._first_solid_offset(x, y, z, self._collision_offsets) is not None
+    
+    def _first_solid_offset(self, x: float, y: float, z: float,
+                            offsets: Tuple[Tuple[float, float, float], ...]
+                            ) -> Optional[Tuple[float, float, float]]:
+        """Return the first offset whose block at (x, y, z) + offset is solid, or None."""
+        get_block_id = self.world.get_block_id
+        for offset in offsets:
+            dx, dy, dz = offset
+            if get_block_id(math.floor(x + dx), math.floor(y + dy), math.floor(z + dz)) != AIR_ID:
+                return offset
+        return None
     
     def _handle_gravity(self):
         """Apply gravity and handle jumping."""
+        position = self.position
+        x, y, z = position.x, position.y, position.z
+        block_x = math.floor(x)
+        block_z = math.floor(z)
+        
         # Check if grounded
-        ground_check_pos = self.position + Vec3(0, -0.1, 0)
-        ground_block = self.world.get_block(
-            int(math.floor(ground_check_pos.x)),
-            int(math.floor(ground_check_pos.y)),
-            int(math.floor(ground_check_pos.z))
-        )
+        ground_block = self.world.get_block_id(block_x, math.floor(y - 0.1), block_z)
         
-        self.grounded = ground_block != BlockType.AIR
+        self.grounded = ground_block != AIR_ID
         
         # Jumping
         if self.grounded and held_keys['space']:
@@ -274,40 +271,27 @@ class Player(Entity):
             self.velocity_y = max(0, self.velocity_y)  # Reset if grounded
         
         # Apply vertical movement
-        new_y = self.position.y + self.velocity_y * time.dt
+        new_y = y + self.velocity_y * time.dt
         
         # Check vertical collision
         if self.velocity_y > 0:
             # Moving up - check head collision
-            head_pos = Vec3(self.position.x, new_y + self.height, self.position.z)
-            head_block = self.world.get_block(
-                int(math.floor(head_pos.x)),
-                int(math.floor(head_pos.y)),
-                int(math.floor(head_pos.z))
-            )
-            if head_block != BlockType.AIR:
+            head_block = self.world.get_block_id(block_x, math.floor(new_y + self.height), block_z)
+            if head_block != AIR_ID:
                 self.velocity_y = 0
                 return
         else:
             # Moving down - check feet collision
-            feet_pos = Vec3(self.position.x, new_y, self.position.z)
-            feet_block = self.world.get_block(
-                int(math.floor(feet_pos.x)),
-                int(math.floor(feet_pos.y)),
-                int(math.floor(feet_pos.z))
-            )
-            if feet_block != BlockType.AIR:
+            feet_y = math.floor(new_y)
+            feet_block = self.world.get_block_id(block_x, feet_y, block_z)
+            if feet_block != AIR_ID:
                 # Snap to top of block
-                self.position = Vec3(
-                    self.position.x,
-                    math.floor(feet_pos.y) + 1,
-                    self.position.z
-                )
+                self.position = Vec3(x, feet_y + 1, z)
                 self.velocity_y = 0
                 self.grounded = True
                 return
         
-        self.position = Vec3(self.position.x, new_y, self.position.z)
+        self.position = Vec3(x, new_y, z)
     
     def _handle_block_interaction(self):
         """Handle left-click (remove) and right-click (place) block."""
@@ -357,10 +341,13 @@ class Player(Entity):
             if result:
                 _, place_pos = result
                 
-                # Don't place block inside player
+                # Don't place block inside player (feet and head blocks)
+                position = self.position
+                block_x = math.floor(position.x)
+                block_z = math.floor(position.z)
                 player_blocks = [
-                    (int(math.floor(self.position.x)), int(math.floor(self.position.y)), int(math.floor(self.position.z))),
-                    (int(math.floor(self.position.x)), int(math.floor(self.position.y + 1)), int(math.floor(self.position.z))),
+                    (block_x, math.floor(position.y), block_z),
+                    (block_x, math.floor(position.y + 1), block_z),
                 ]
                 
                 if place_pos not in player_blocks:
@@ -0,0 +1,84 @@
+"""
+raycast.py - Voxel Raycasting Kernel
+
+DDA (Digital Differential Analyzer) traversal compiled with Numba.
+
+The kernel cannot look blocks up through the world's chunk dictionary,
+so World.raycast_block first copies the blocks within reach of the ray
+into a small window array and the kernel steps through that. The ray
+only visits voxels inside its own bounding box, so the window only has
+to cover that box (plus a block of margin), not a cube around the start.
+"""
+
+import math
+
+import numpy as np
+
+from jit import njit
+from voxel import AIR_ID
+
+
+@njit('UniTuple(i8, 7)(u1[:, :, ::1], f8, f8, f8, f8, f8, f8, f8)', cache=True)
+def dda(window, ox, oy, oz, dx, dy, dz, max_distance):
+    """
+    Find the first solid block along a ray.
+
+    Args:
+        window: (X, Y, Z) uint8 block IDs, indexed in window coordinates
+        ox, oy, oz: Ray origin in window coordinates
+        dx, dy, dz: Normalized ray direction
+        max_distance: Maximum ray travel distance
+
+    Returns:
+        (hit, x, y, z, prev_x, prev_y, prev_z) in window coordinates;
+        hit is 0 if no solid block was reached
+    """
+    # Current voxel position
+    x = int(math.floor(ox))
+    y = int(math.floor(oy))
+    z = int(math.floor(oz))
+
+    # Direction to step in each axis
+    step_x = 1 if dx >= 0 else -1
+    step_y = 1 if dy >= 0 else -1
+    step_z = 1 if dz >= 0 else -1
+
+    # Distance to next voxel boundary for each axis, and how far to move
+    # in t for each voxel step (infinite along axes the ray is parallel to)
+    t_max_x = ((x + (1 if step_x > 0 else 0)) - ox) / dx if dx != 0 else np.inf
+    t_max_y = ((y + (1 if step_y > 0 else 0)) - oy) / dy if dy != 0 else np.inf
+    t_max_z = ((z + (1 if step_z > 0 else 0)) - oz) / dz if dz != 0 else np.inf
+    t_delta_x = abs(1 / dx) if dx != 0 else np.inf
+    t_delta_y = abs(1 / dy) if dy != 0 else np.inf
+    t_delta_z = abs(1 / dz) if dz != 0 else np.inf
+
+    size_x, size_y, size_z = window.shape
+    prev_x, prev_y, prev_z = x, y, z
+    traveled = 0.0
+
+    while traveled < max_distance:
+        if not (0 <= x < size_x and 0 <= y < size_y and 0 <= z < size_z):
+            break
+
+        # Check current voxel
+        if window[x, y, z] != AIR_ID:
+            return 1, x, y, z, prev_x, prev_y, prev_z
+
+        # Save previous position for block placement
+        prev_x, prev_y, prev_z = x, y, z
+
+        # Step to next voxel
+        if t_max_x < t_max_y and t_max_x < t_max_z:
+            traveled = t_max_x
+            t_max_x += t_delta_x
+            x += step_x
+        elif t_max_y < t_max_z:
+            traveled = t_max_y
+            t_max_y += t_delta_y
+            y += step_y
+        else:
+            traveled = t_max_z
+            t_max_z += t_delta_z
+            z += step_z
+
+    return 0, x, y, z, prev_x, prev_y, prev_z
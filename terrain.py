@@ -0,0 +1,112 @@
+"""
+terrain.py - Compiled Chunk Terrain Kernels
+
+Fills a chunk's block array from its column heights and plants its
+trees in a single pass over the (4 KB) array, instead of a NumPy fill
+followed by Python loops for the trees.
+
+Tree positions and trunk heights are drawn by the caller (see
+world._tree_candidates), so the compiled path and the NumPy fallback
+in World.generate_chunk_blocks plant identical trees. Without Numba,
+plant_trees runs as plain Python, which is fine for the few trees a
+chunk gets; fill_chunk would loop over every block, so the fallback
+fills the terrain with NumPy instead.
+"""
+
+from jit import njit
+from voxel import AIR_ID, GRASS_ID, DIRT_ID, STONE_ID, WOOD_ID, LEAVES_ID
+
+# Trees need this many blocks above the surface inside the chunk
+TREE_CLEARANCE = 6
+
+
+@njit('void(u1[:, :, ::1], i8, i8, i8, i8)', cache=True, nogil=True, inline='always')
+def place_tree(blocks, base_x, base_y, base_z, trunk_height):
+    """
+    Place a tree at the given position in a chunk's block array.
+
+    Args:
+        blocks: (S, S, S) uint8 block IDs, indexed [x, y, z]
+        base_x, base_y, base_z: Local position of the bottom trunk block
+        trunk_height: Number of wood blocks in the trunk
+    """
+    size = blocks.shape[0]
+
+    # Place trunk (wood blocks)
+    for y in range(trunk_height):
+        if 0 <= base_y + y < size:
+            blocks[base_x, base_y + y, base_z] = WOOD_ID
+
+    # Place leaves (sphere around top of trunk)
+    leaf_center_y = base_y + trunk_height - 1
+    leaf_radius = 2
+
+    for dx in range(-leaf_radius, leaf_radius + 1):
+        for dy in range(-1, leaf_radius + 1):
+            for dz in range(-leaf_radius, leaf_radius + 1):
+                # Spherical check
+                dist = abs(dx) + abs(dy) + abs(dz)
+                if dist <= leaf_radius + 1:
+                    lx = base_x + dx
+                    ly = leaf_center_y + dy
+                    lz = base_z + dz
+
+                    # Check bounds
+                    if 0 <= lx < size and 0 <= ly < size and 0 <= lz < size:
+                        # Don't overwrite trunk
+                        if blocks[lx, ly, lz] == AIR_ID:
+                            blocks[lx, ly, lz] = LEAVES_ID
+
+
+@njit('void(i4[:, ::1], i8, i8[:, ::1], u1[:, :, ::1])', cache=True, nogil=True)
+def plant_trees(heights, base_y, trees, blocks):
+    """
+    Plant trees on the grass surface of a filled chunk.
+
+    Args:
+        heights: (S, S) world surface height per (x, z) column
+        base_y: World Y of the chunk's bottom layer
+        trees: (N, 3) candidate (local_x, local_z, trunk_height) rows
+        blocks: (S, S, S) uint8 block IDs, indexed [x, y, z]
+    """
+    size = blocks.shape[0]
+    for i in range(trees.shape[0]):
+        x = trees[i, 0]
+        z = trees[i, 1]
+
+        # Surface must be in this chunk, grass, and leave room for the tree
+        y = heights[x, z] - base_y
+        if 0 <= y < size - TREE_CLEARANCE and blocks[x, y, z] == GRASS_ID:
+            place_tree(blocks, x, y + 1, z, trees[i, 2])
+
+
+@njit('void(i4[:, ::1], i8, i8[:, ::1], u1[:, :, ::1])', cache=True, nogil=True)
+def fill_chunk(heights, base_y, trees, blocks):
+    """
+    Fill a chunk's terrain and plant its trees.
+
+    Every column is stone up to 4 blocks below its surface, then dirt,
+    grass at the surface and air above.
+
+    Args:
+        heights: (S, S) world surface height per (x, z) column
+        base_y: World Y of the chunk's bottom layer
+        trees: (N, 3) candidate (local_x, local_z, trunk_height) rows
+        blocks: (S, S, S) uint8 output block IDs, indexed [x, y, z]
+    """
+    size = blocks.shape[0]
+    for x in range(size):
+        for y in range(size):
+            world_y = base_y + y
+            for z in range(size):
+                surface_height = heights[x, z]
+                if world_y > surface_height:
+                    blocks[x, y, z] = AIR_ID
+                elif world_y == surface_height:
+                    blocks[x, y, z] = GRASS_ID
+                elif world_y >= surface_height - 3:
+                    blocks[x, y, z] = DIRT_ID
+                else:
+                    blocks[x, y, z] = STONE_ID
+
+    plant_trees(heights, base_y, trees, blocks)
@@ -16,6 +16,8 @@ UV Coordinates:
 from enum import IntEnum
 from typing import Dict, Tuple, List
 
+import numpy as np
+
 class BlockType(IntEnum):
     """
     Block type enumeration.
@@ -32,6 +34,18 @@ class BlockType(IntEnum):
     PLANKS = 7
     LEAVES = 8
 
+# Raw block IDs for hot paths: compare uint8 block arrays against plain
+# ints instead of going through IntEnum. Use BlockType at API boundaries.
+AIR_ID = int(BlockType.AIR)
+GRASS_ID = int(BlockType.GRASS)
+DIRT_ID = int(BlockType.DIRT)
+STONE_ID = int(BlockType.STONE)
+WOOD_ID = int(BlockType.WOOD)
+SAND_ID = int(BlockType.SAND)
+COBBLESTONE_ID = int(BlockType.COBBLESTONE)
+PLANKS_ID = int(BlockType.PLANKS)
+LEAVES_ID = int(BlockType.LEAVES)
+
 class Face(IntEnum):
     """
     Face direction enumeration.
@@ -141,6 +155,24 @@ BLOCK_TEXTURES: Dict[BlockType, Dict[Face, int]] = {
     },
 }
 
+def _build_uv_rects() -> np.ndarray:
+    """
+    Look up the atlas rectangle of every block type and face once.
+    
+    Returns:
+        (n_block_types, 6, 4) float32 array of (u_min, v_min, u_max, v_max);
+        all zeros for AIR
+    """
+    rects = np.zeros((len(BlockType), len(Face), 4), dtype=np.float32)
+    for block_type, faces in BLOCK_TEXTURES.items():
+        for face, texture_index in faces.items():
+            rects[block_type, face] = (texture_index / ATLAS_WIDTH, 0.0,
+                                       (texture_index + 1) / ATLAS_WIDTH, 1.0)
+    return rects
+
+# Atlas rectangle per block type and face, indexed UV_RECTS[block_type, face]
+UV_RECTS = _build_uv_rects()
+
 def get_block_uvs(block_type: BlockType, face: Face) -> Tuple[float, float, float, float]:
     """
     Get the UV coordinates for a specific block face.
@@ -152,14 +184,7 @@ def get_block_uvs(block_type: BlockType, face: Face) -> Tuple[float, float, floa
     Returns:
         (u_min, v_min, u_max, v_max) UV coordinates
     """
-    if block_type == BlockType.AIR:
-        return (0, 0, 0, 0)
-    
-    texture_index = BLOCK_TEXTURES[block_type][face]
-    u_min = texture_index / ATLAS_WIDTH
-    u_max = (texture_index + 1) / ATLAS_WIDTH
-    
-    return (u_min, 0.0, u_max, 1.0)
+    return tuple(UV_RECTS[block_type, face].tolist())
 
 # Vertex positions for each face of a unit cube (1x1x1)
 # Each face is defined by 4 vertices in counter-clockwise order (for correct normals)
@@ -194,3 +219,25 @@ FACE_UVS: List[Tuple[float, float]] = [
 # Triangle indices for a quad face (2 triangles)
 # References the 4 vertices defined in FACE_VERTICES
 QUAD_INDICES: List[int] = [0, 1, 2, 0, 2, 3]
+
+# Array versions of the tables above for the meshing kernels,
+# indexed by Face value so a whole face can be copied in one slice
+FACE_DIRECTIONS_ARR = np.array(FACE_DIRECTIONS, dtype=np.int8)                         # (6, 3)
+FACE_VERTICES_ARR = np.array([FACE_VERTICES[face] for face in Face], dtype=np.float32)  # (6, 4, 3)
+FACE_UVS_ARR = np.array(FACE_UVS, dtype=np.float32)                                    # (4, 2)
+QUAD_INDICES_ARR = np.array(QUAD_INDICES, dtype=np.int32)                              # (6,)
+
+def _build_uv_table() -> np.ndarray:
+    """
+    Expand UV_RECTS into per-corner atlas UVs for every block type and face.
+    
+    Returns:
+        (n_block_types, 6, 4, 2) float32 array; corners follow FACE_UVS order
+    """
+    # Each corner takes the rectangle's min or max along U and V
+    u = np.where(FACE_UVS_ARR[:, 0] == 0, UV_RECTS[..., 0:1], UV_RECTS[..., 2:3])
+    v = np.where(FACE_UVS_ARR[:, 1] == 0, UV_RECTS[..., 1:2], UV_RECTS[..., 3:4])
+    return np.stack([u, v], axis=-1)
+
+# Atlas UVs for each corner of each block face, indexed UV_TABLE[block_type, face]
+UV_TABLE = _build_uv_table()
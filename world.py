@@ -11,16 +11,99 @@ Terrain Layers:
 """
 
 from ursina import Entity, Vec3, camera, destroy
-from typing import Dict, Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List, Set
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import heapq
 import math
+import os
+import queue
+import numpy as np
 
-from chunk import Chunk, CHUNK_SIZE, world_to_chunk_pos, world_to_local_pos
-from voxel import BlockType
-from noise import get_terrain_height
+from chunk import Chunk, CHUNK_SIZE, CHUNK_SHIFT, CHUNK_MASK, world_to_chunk_pos, build_mesh_arrays
+from voxel import BlockType, AIR_ID, GRASS_ID, DIRT_ID, STONE_ID, FACE_DIRECTIONS
+from noise import heightmap_block
+from raycast import dda
+from terrain import fill_chunk, plant_trees
+from jit import NUMBA_AVAILABLE
 
 # How many chunks to load around the player
 RENDER_DISTANCE = 3  # chunks in each direction
 
+# Threads building chunk meshes in the background
+MESH_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# Threads generating chunk terrain in the background
+GENERATION_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# Frustum culling: frustum plane normal drift after which every chunk is
+# rechecked, and slack added to the drift bound for float rounding
+_CULLING_MAX_DRIFT = 0.25
+_CULLING_EPSILON = 1e-4
+
+
+_MASK_64 = (1 << 64) - 1
+_UNIT_FLOAT = 2.0 ** -53
+
+
+def _splitmix64(state: int) -> int:
+    """Scramble a 64-bit state into a well-mixed 64-bit value (splitmix64 finalizer)."""
+    z = (state + 0x9E3779B97F4A7C15) & _MASK_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return z ^ (z >> 31)
+
+
+def _chunk_random(chunk_pos: Tuple[int, int, int], count: int) -> List[int]:
+    """
+    Draw reproducible random 64-bit ints for a chunk.
+    
+    Hashes the chunk position instead of seeding the shared `random` module,
+    so chunks can be generated on several threads at once.
+    
+    Args:
+        chunk_pos: Chunk coordinates, used as the seed
+        count: How many values to draw
+    
+    Returns:
+        List of `count` ints in [0, 2^64)
+    """
+    cx, cy, cz = chunk_pos
+    seed = ((cx * 73856093) ^ (cy * 19349663) ^ (cz * 83492791)) & _MASK_64
+    return [_splitmix64((seed + i * 0x9E3779B97F4A7C15) & _MASK_64) for i in range(1, count + 1)]
+
+
+def _tree_candidates(chunk_pos: Tuple[int, int, int]) -> np.ndarray:
+    """
+    Pick where a chunk may grow trees.
+    
+    Whether a tree is actually planted also depends on the terrain
+    (see terrain.plant_trees).
+    
+    Returns:
+        (N, 3) int64 rows of (local_x, local_z, trunk_height)
+    """
+    # Try to place a few trees per chunk
+    num_tree_attempts = 3
+    
+    # Use chunk position as seed for consistent tree placement; each
+    # attempt gets 4 random values: x, z, placement chance, trunk height
+    rolls = _chunk_random(chunk_pos, num_tree_attempts * 4)
+    
+    candidates = []
+    for attempt in range(num_tree_attempts):
+        roll_x, roll_z, roll_chance, roll_height = rolls[attempt * 4:attempt * 4 + 4]
+        
+        # Random chance to place a tree (top 53 bits as a float in [0, 1))
+        if (roll_chance >> 11) * _UNIT_FLOAT < 0.4:
+            candidates.append((
+                2 + roll_x % (CHUNK_SIZE - 4),  # Keep away from edges
+                2 + roll_z % (CHUNK_SIZE - 4),
+                4 + roll_height % 3,
+            ))
+    
+    return np.array(candidates, dtype=np.int64).reshape(-1, 3)
+
 
 class World(Entity):
     """
@@ -38,15 +121,116 @@ class World(Entity):
         # Track player's last chunk position for loading updates
         self._last_player_chunk: Optional[Tuple[int, int, int]] = None
         
+        # Chunk offsets around the player's chunk that are kept loaded, and the
+        # resulting chunk positions for the current player chunk
+        self._render_offsets: List[Tuple[int, int, int]] = [
+            (dx, dy, dz)
+            for dx in range(-RENDER_DISTANCE, RENDER_DISTANCE + 1)
+            for dy in range(-2, 3)  # Vertical range is smaller
+            for dz in range(-RENDER_DISTANCE, RENDER_DISTANCE + 1)
+        ]
+        self._chunks_to_load: Set[Tuple[int, int, int]] = set()
+        
+        # Surface heights per (cx, cz) chunk column, shared by the chunks stacked
+        # in it. Generation workers fill it; entries for columns that left the
+        # render distance are dropped when the player changes chunk, or when a
+        # late worker result for such a column is discarded
+        self._height_cache: Dict[Tuple[int, int], np.ndarray] = {}
+        self._columns_to_load: Set[Tuple[int, int]] = set()
+        
         # Chunk loading queue for gradual loading (prevents frame stutter)
-        self._chunk_load_queue: List[Tuple[int, int, int]] = []
+        # Min-heap of (behind the camera, squared chunk distance to the player,
+        # chunk_pos) so visible, nearby chunks load first, plus the same
+        # positions as a set for lookups
+        self._chunk_load_queue: List[Tuple[bool, int, Tuple[int, int, int]]] = []
+        self._queued_chunks: Set[Tuple[int, int, int]] = set()
         self._chunks_per_frame = 2  # Load 2 chunks per frame max
         self._initial_load_complete = False  # First load is synchronous
+        
+        # Culling works on arrays parallel to a snapshot of self.chunks,
+        # rebuilt on the next cull after chunks are loaded or unloaded:
+        # chunk centers (3, N) and the visibility last written to each chunk (N,)
+        self._culling_chunks: Optional[List[Chunk]] = None
+        self._culling_centers = np.empty((3, 0))
+        self._culling_visible = np.empty(0, dtype=bool)
+        
+        # Camera position, frustum plane normals and visibility at the last full
+        # culling pass, and per chunk: how far its box was from crossing a plane
+        # (blocks) and its center's distance from the camera then
+        self._culling_origin = np.zeros(3)
+        self._culling_normals = np.zeros((5, 3))
+        self._culling_reference_visible = np.empty(0, dtype=bool)
+        self._culling_at_reference = False
+        self._culling_margin = np.empty(0)
+        self._culling_distance = np.empty(0)
+        
+        # Background terrain generation: workers fill block arrays, the main
+        # thread wraps finished ones in Chunk entities
+        self._generation_pool = ThreadPoolExecutor(max_workers=GENERATION_WORKERS,
+                                                   thread_name_prefix='chunk-generator')
+        self._pending_chunks: Dict[Tuple[int, int, int], Future] = {}
+        
+        # Background mesh building: workers build mesh arrays, the main
+        # thread uploads them (Ursina/Panda3D calls are not thread-safe)
+        self._mesh_pool = ThreadPoolExecutor(max_workers=MESH_WORKERS,
+                                             thread_name_prefix='chunk-mesher')
+        self._finished_meshes: "queue.Queue[Future]" = queue.Queue()
+        
+        # Chunks edited since their mesh was last rebuilt, in edit order. Each
+        # is rebuilt once when the set_block call (or batched_edit) that
+        # queued it finishes, however many of its blocks changed in between
+        self._dirty_chunks: Dict[Tuple[int, int, int], Chunk] = {}
+        self._in_batched_edit = False
+    
+    def request_mesh(self, chunk: Chunk) -> None:
+        """
+        Rebuild a chunk's mesh on a worker thread.
+        
+        The result is uploaded by upload_finished_meshes on a later frame;
+        until then the chunk keeps its old mesh.
+        """
+        version, padded, mesh_cache, dirty_aabb = chunk.prepare_mesh_job()
+        
+        def build():
+            return chunk, version, build_mesh_arrays(padded, mesh_cache, dirty_aabb)
+        
+        future = self._mesh_pool.submit(build)
+        future.add_done_callback(self._finished_meshes.put)
+    
+    def upload_finished_meshes(self) -> None:
+        """Upload meshes finished by the workers. Call once per frame on the main thread."""
+        while True:
+            try:
+                future = self._finished_meshes.get_nowait()
+            except queue.Empty:
+                return
+            
+            # Re-raises any exception from the worker here
+            chunk, version, arrays = future.result()
+            
+            # Skip chunks unloaded while their mesh was building
+            if self.chunks.get(chunk.chunk_pos) is chunk:
+                chunk.apply_mesh(version, arrays)
     
     def get_chunk(self, chunk_pos: Tuple[int, int, int]) -> Optional[Chunk]:
         """Get a chunk by its chunk coordinates."""
         return self.chunks.get(chunk_pos)
     
+    def get_neighbor_chunks(self, chunk_pos: Tuple[int, int, int]) -> List[Optional[Chunk]]:
+        """
+        Get the 6 face-adjacent chunks of a chunk, in Face order.
+        
+        Meshing fetches these once per rebuild. Lookups stay plain dict
+        gets: a cache in front of them would have to be invalidated on
+        every load/unload and would not be cheaper than the dict itself.
+        
+        Returns:
+            List of 6 chunks (None where not loaded)
+        """
+        cx, cy, cz = chunk_pos
+        chunks = self.chunks
+        return [chunks.get((cx + dx, cy + dy, cz + dz)) for dx, dy, dz in FACE_DIRECTIONS]
+    
     def get_block(self, world_x: int, world_y: int, world_z: int) -> BlockType:
         """
         Get the block at world coordinates.
@@ -57,14 +241,53 @@ class World(Entity):
         Returns:
             BlockType at that position, or AIR if chunk not loaded
         """
-        chunk_pos = world_to_chunk_pos(world_x, world_y, world_z)
-        chunk = self.get_chunk(chunk_pos)
+        return BlockType(self.get_block_id(world_x, world_y, world_z))
+    
+    def get_block_id(self, world_x: int, world_y: int, world_z: int) -> int:
+        """
+        Get the raw block ID at world coordinates (no BlockType wrapping).
         
+        Returns:
+            Block ID at that position, or AIR_ID if chunk not loaded
+        """
+        chunk = self.chunks.get((world_x >> CHUNK_SHIFT, world_y >> CHUNK_SHIFT, world_z >> CHUNK_SHIFT))
         if chunk is None:
-            return BlockType.AIR
+            return AIR_ID
+        return int(chunk.blocks[world_x & CHUNK_MASK, world_y & CHUNK_MASK, world_z & CHUNK_MASK])
+    
+    def get_block_region(self, x0: int, y0: int, z0: int,
+                         size_x: int, size_y: int, size_z: int) -> np.ndarray:
+        """
+        Copy a box of blocks out of the loaded chunks.
         
-        local_pos = world_to_local_pos(world_x, world_y, world_z)
-        return chunk.get_block(*local_pos)
+        Args:
+            x0, y0, z0: World coordinates of the box's minimum corner
+            size_x, size_y, size_z: Box size in blocks
+        
+        Returns:
+            (size_x, size_y, size_z) uint8 block IDs, AIR_ID where no chunk is loaded
+        """
+        region = np.full((size_x, size_y, size_z), AIR_ID, dtype=np.uint8)
+        x1, y1, z1 = x0 + size_x, y0 + size_y, z0 + size_z
+        
+        for cx in range(x0 >> CHUNK_SHIFT, ((x1 - 1) >> CHUNK_SHIFT) + 1):
+            for cy in range(y0 >> CHUNK_SHIFT, ((y1 - 1) >> CHUNK_SHIFT) + 1):
+                for cz in range(z0 >> CHUNK_SHIFT, ((z1 - 1) >> CHUNK_SHIFT) + 1):
+                    chunk = self.chunks.get((cx, cy, cz))
+                    if chunk is None:
+                        continue
+                    
+                    # Overlap of the box and this chunk, in world coordinates
+                    lo_x, hi_x = max(x0, cx * CHUNK_SIZE), min(x1, (cx + 1) * CHUNK_SIZE)
+                    lo_y, hi_y = max(y0, cy * CHUNK_SIZE), min(y1, (cy + 1) * CHUNK_SIZE)
+                    lo_z, hi_z = max(z0, cz * CHUNK_SIZE), min(z1, (cz + 1) * CHUNK_SIZE)
+                    
+                    region[lo_x - x0:hi_x - x0, lo_y - y0:hi_y - y0, lo_z - z0:hi_z - z0] = \
+                        chunk.blocks[lo_x - cx * CHUNK_SIZE:hi_x - cx * CHUNK_SIZE,
+                                     lo_y - cy * CHUNK_SIZE:hi_y - cy * CHUNK_SIZE,
+                                     lo_z - cz * CHUNK_SIZE:hi_z - cz * CHUNK_SIZE]
+        
+        return region
     
     def set_block(self, world_x: int, world_y: int, world_z: int, 
                   block_type: BlockType) -> bool:
@@ -78,20 +301,31 @@ class World(Entity):
         Returns:
             True if successful, False if chunk not loaded
         """
-        chunk_pos = world_to_chunk_pos(world_x, world_y, world_z)
-        chunk = self.get_chunk(chunk_pos)
+        chunk = self.chunks.get((world_x >> CHUNK_SHIFT, world_y >> CHUNK_SHIFT, world_z >> CHUNK_SHIFT))
         
         if chunk is None:
             return False
         
-        local_pos = world_to_local_pos(world_x, world_y, world_z)
-        chunk.set_block(*local_pos, block_type)
+        # Local coordinates are always in range here, so use the array directly
+        local_x, local_y, local_z = world_x & CHUNK_MASK, world_y & CHUNK_MASK, world_z & CHUNK_MASK
+        block_id = int(block_type)
+        
+        # Re-placing the same block changes nothing, so skip the mesh rebuilds
+        if chunk.blocks[local_x, local_y, local_z] == block_id:
+            return True
+        
+        chunk.blocks[local_x, local_y, local_z] = block_id
+        chunk.mark_dirty(local_x, local_y, local_z)
         
         # Rebuild the mesh after modification
-        chunk.rebuild_mesh()
+        self._rebuild_chunk_mesh(chunk)
         
         # Also rebuild neighbor chunks if the block is on a boundary
-        self._rebuild_neighbor_chunks_if_needed(world_x, world_y, world_z, local_pos)
+        self._rebuild_neighbor_chunks_if_needed(world_x, world_y, world_z, (local_x, local_y, local_z))
+        
+        # Single edits show up this frame; batched_edit flushes when it exits
+        if not self._in_batched_edit:
+            self.flush_dirty()
         
         return True
     
@@ -99,142 +333,151 @@ class World(Entity):
                                             local_pos: Tuple[int, int, int]) -> None:
         """Rebuild neighboring chunks if the modified block is on a chunk boundary."""
         lx, ly, lz = local_pos
+        cx, cy, cz = world_x >> CHUNK_SHIFT, world_y >> CHUNK_SHIFT, world_z >> CHUNK_SHIFT
         
         # Check each axis for boundary conditions
         neighbors_to_rebuild = []
         
         if lx == 0:
-            neighbors_to_rebuild.append(world_to_chunk_pos(world_x - 1, world_y, world_z))
-        elif lx == CHUNK_SIZE - 1:
-            neighbors_to_rebuild.append(world_to_chunk_pos(world_x + 1, world_y, world_z))
+            neighbors_to_rebuild.append((cx - 1, cy, cz))
+        elif lx == CHUNK_MASK:
+            neighbors_to_rebuild.append((cx + 1, cy, cz))
         
         if ly == 0:
-            neighbors_to_rebuild.append(world_to_chunk_pos(world_x, world_y - 1, world_z))
-        elif ly == CHUNK_SIZE - 1:
-            neighbors_to_rebuild.append(world_to_chunk_pos(world_x, world_y + 1, world_z))
+            neighbors_to_rebuild.append((cx, cy - 1, cz))
+        elif ly == CHUNK_MASK:
+            neighbors_to_rebuild.append((cx, cy + 1, cz))
         
         if lz == 0:
-            neighbors_to_rebuild.append(world_to_chunk_pos(world_x, world_y, world_z - 1))
-        elif lz == CHUNK_SIZE - 1:
-            neighbors_to_rebuild.append(world_to_chunk_pos(world_x, world_y, world_z + 1))
+            neighbors_to_rebuild.append((cx, cy, cz - 1))
+        elif lz == CHUNK_MASK:
+            neighbors_to_rebuild.append((cx, cy, cz + 1))
         
         for neighbor_pos in neighbors_to_rebuild:
             neighbor = self.get_chunk(neighbor_pos)
             if neighbor:
-                neighbor.rebuild_mesh()
+                # The edited block sits just outside the neighbor's bounds
+                ncx, ncy, ncz = neighbor_pos
+                neighbor.mark_dirty(world_x - ncx * CHUNK_SIZE,
+                                    world_y - ncy * CHUNK_SIZE,
+                                    world_z - ncz * CHUNK_SIZE)
+                self._rebuild_chunk_mesh(neighbor)
     
-    def generate_chunk(self, chunk_pos: Tuple[int, int, int]) -> Chunk:
+    def _rebuild_chunk_mesh(self, chunk: Chunk) -> None:
+        """Queue a chunk's mesh for rebuilding by the next flush_dirty."""
+        self._dirty_chunks[chunk.chunk_pos] = chunk
+    
+    def flush_dirty(self) -> None:
         """
-        Generate a new chunk with terrain.
+        Rebuild the meshes of chunks edited since their last rebuild.
         
-        Uses Perlin noise to determine surface height, then fills:
-        - Stone: More than 4 blocks below surface
-        - Dirt: 1-4 blocks below surface
-        - Grass: At surface level
+        Each chunk is rebuilt once, covering the combined dirty box of all
+        its edits.
         """
-        chunk = Chunk(chunk_pos, self)
+        dirty, self._dirty_chunks = self._dirty_chunks, {}
+        for chunk_pos, chunk in dirty.items():
+            # Skip chunks unloaded since they were edited
+            if self.chunks.get(chunk_pos) is chunk:
+                chunk.rebuild_mesh()
+    
+    @contextmanager
+    def batched_edit(self):
+        """
+        Defer mesh rebuilds while changing many blocks.
         
-        cx, cy, cz = chunk_pos
+        Inside the block, set_block only records which chunks changed; on
+        exit each changed chunk (and touched neighbor) is rebuilt once,
+        covering the combined dirty box of all its edits:
         
-        # Generate terrain for each column in the chunk
-        for local_x in range(CHUNK_SIZE):
-            for local_z in range(CHUNK_SIZE):
-                # Convert to world coordinates for noise
-                world_x = cx * CHUNK_SIZE + local_x
-                world_z = cz * CHUNK_SIZE + local_z
-                
-                # Get terrain height from Perlin noise
-                surface_height = get_terrain_height(world_x, world_z)
-                
-                # Fill blocks from bottom of chunk to surface
-                for local_y in range(CHUNK_SIZE):
-                    world_y = cy * CHUNK_SIZE + local_y
-                    
-                    if world_y > surface_height:
-                        # Above surface - air
-                        block_type = BlockType.AIR
-                    elif world_y == surface_height:
-                        # Surface - grass
-                        block_type = BlockType.GRASS
-                    elif world_y >= surface_height - 3:
-                        # Just below surface - dirt
-                        block_type = BlockType.DIRT
-                    else:
-                        # Deep underground - stone
-                        block_type = BlockType.STONE
-                    
-                    chunk.set_block(local_x, local_y, local_z, block_type)
+            with world.batched_edit():
+                for x, y, z in positions:
+                    world.set_block(x, y, z, BlockType.AIR)
         
-        # Generate trees on this chunk
-        self._generate_trees(chunk, chunk_pos)
+        Nested batches are merged into the outermost one.
+        """
+        if self._in_batched_edit:
+            yield
+            return
         
-        # Generate the optimized mesh
-        chunk.generate_mesh()
+        self._in_batched_edit = True
+        try:
+            yield
+        finally:
+            self._in_batched_edit = False
+            self.flush_dirty()
+    
+    def generate_chunk(self, chunk_pos: Tuple[int, int, int]) -> Chunk:
+        """
+        Generate a new chunk with terrain, register it and queue its mesh.
         
+        The mesh is built on a worker thread and shown once
+        upload_finished_meshes picks it up. Creates an Entity, so only
+        call this on the main thread.
+        """
+        chunk = self._add_chunk(chunk_pos, self.generate_chunk_blocks(chunk_pos))
+        self.request_mesh(chunk)
         return chunk
     
-    def _generate_trees(self, chunk: Chunk, chunk_pos: Tuple[int, int, int]) -> None:
-        """Generate trees on grass blocks in this chunk."""
-        import random
+    def generate_chunk_blocks(self, chunk_pos: Tuple[int, int, int]) -> np.ndarray:
+        """
+        Generate the terrain blocks of a chunk.
         
+        Uses Perlin noise to determine surface height, then fills:
+        - Stone: More than 4 blocks below surface
+        - Dirt: 1-4 blocks below surface
+        - Grass: At surface level
+        
+        Touches no Entity state and only the (thread-safe) height cache of
+        the world, so it can run on any thread.
+        
+        Returns:
+            (CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE) uint8 block IDs, indexed [x, y, z]
+        """
         cx, cy, cz = chunk_pos
         
-        # Use chunk position as seed for consistent tree placement
-        random.seed(cx * 1000 + cz * 37 + cy)
+        # Terrain heights from Perlin noise for every column in the chunk,
+        # computed once per chunk column. Two workers may both miss and compute
+        # the same heights, which is harmless: single dict operations are atomic
+        heights = self._height_cache.get((cx, cz))
+        if heights is None:
+            heights = heightmap_block(cx * CHUNK_SIZE, cz * CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE)
+            self._height_cache[(cx, cz)] = heights
+        
+        base_y = cy * CHUNK_SIZE
+        
+        # Chunks wholly above the surface are air (trees only grow from a
+        # surface inside the chunk), and those wholly below the dirt are stone
+        if base_y > heights.max():
+            return np.full((CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE), AIR_ID, dtype=np.uint8)
+        if base_y + CHUNK_SIZE - 1 < heights.min() - 3:
+            return np.full((CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE), STONE_ID, dtype=np.uint8)
+        
+        trees = _tree_candidates(chunk_pos)
+        
+        if NUMBA_AVAILABLE:
+            # Terrain and trees in one compiled pass
+            blocks = np.empty((CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+            fill_chunk(heights, base_y, trees, blocks)
+            return blocks
+        
+        # Fill all columns at once: blocks are indexed [x, y, z], so world_y
+        # runs along axis 1 and each (x, z) column's surface height broadcasts over it
+        world_y = (base_y + np.arange(CHUNK_SIZE))[None, :, None]
+        surface_height = heights[:, None, :]
+        blocks = np.select(
+            [
+                world_y > surface_height,       # Above surface - air
+                world_y == surface_height,      # Surface - grass
+                world_y >= surface_height - 3,  # Just below surface - dirt
+            ],
+            [AIR_ID, GRASS_ID, DIRT_ID],
+            default=STONE_ID,                   # Deep underground - stone
+        ).astype(np.uint8)
         
-        # Try to place a few trees per chunk
-        num_tree_attempts = 3
+        # Generate trees on this chunk
+        plant_trees(heights, base_y, trees, blocks)
         
-        for _ in range(num_tree_attempts):
-            # Random position in chunk
-            local_x = random.randint(2, CHUNK_SIZE - 3)  # Keep away from edges
-            local_z = random.randint(2, CHUNK_SIZE - 3)
-            
-            world_x = cx * CHUNK_SIZE + local_x
-            world_z = cz * CHUNK_SIZE + local_z
-            
-            # Find the surface at this position
-            surface_height = get_terrain_height(world_x, world_z)
-            local_y = surface_height - cy * CHUNK_SIZE
-            
-            # Check if surface is in this chunk and is grass
-            if 0 <= local_y < CHUNK_SIZE - 6:  # Need room for tree
-                if chunk.get_block(local_x, local_y, local_z) == BlockType.GRASS:
-                    # Random chance to place a tree
-                    if random.random() < 0.4:
-                        self._place_tree(chunk, local_x, local_y + 1, local_z)
-    
-    def _place_tree(self, chunk: Chunk, base_x: int, base_y: int, base_z: int) -> None:
-        """Place a tree at the given position in the chunk."""
-        import random
-        
-        # Tree height (trunk)
-        trunk_height = random.randint(4, 6)
-        
-        # Place trunk (wood blocks)
-        for y in range(trunk_height):
-            if 0 <= base_y + y < CHUNK_SIZE:
-                chunk.set_block(base_x, base_y + y, base_z, BlockType.WOOD)
-        
-        # Place leaves (sphere around top of trunk)
-        leaf_center_y = base_y + trunk_height - 1
-        leaf_radius = 2
-        
-        for dx in range(-leaf_radius, leaf_radius + 1):
-            for dy in range(-1, leaf_radius + 1):
-                for dz in range(-leaf_radius, leaf_radius + 1):
-                    # Spherical check
-                    dist = abs(dx) + abs(dy) + abs(dz)
-                    if dist <= leaf_radius + 1:
-                        lx = base_x + dx
-                        ly = leaf_center_y + dy
-                        lz = base_z + dz
-                        
-                        # Check bounds
-                        if 0 <= lx < CHUNK_SIZE and 0 <= ly < CHUNK_SIZE and 0 <= lz < CHUNK_SIZE:
-                            # Don't overwrite trunk
-                            if chunk.get_block(lx, ly, lz) == BlockType.AIR:
-                                chunk.set_block(lx, ly, lz, BlockType.LEAVES)
+        return blocks
     
     def load_chunks_around(self, center_x: float, center_y: float, center_z: float) -> None:
         """
@@ -244,60 +487,97 @@ class World(Entity):
         """
         center_chunk = world_to_chunk_pos(int(center_x), int(center_y), int(center_z))
         
-        # Track last chunk for optimization, but still check for new chunks needed
-        chunk_changed = center_chunk != self._last_player_chunk
-        self._last_player_chunk = center_chunk
-        
-        # Determine which chunks should be loaded
-        chunks_to_load = set()
-        
-        for dx in range(-RENDER_DISTANCE, RENDER_DISTANCE + 1):
-            for dy in range(-2, 3):  # Vertical range is smaller
-                for dz in range(-RENDER_DISTANCE, RENDER_DISTANCE + 1):
-                    chunk_pos = (
-                        center_chunk[0] + dx,
-                        center_chunk[1] + dy,
-                        center_chunk[2] + dz,
-                    )
-                    chunks_to_load.add(chunk_pos)
-        
-        # Only do work if chunk changed (optimization)
-        if not chunk_changed and len(self.chunks) > 0:
-            # Quick check if all needed chunks are loaded
-            all_loaded = all(pos in self.chunks for pos in chunks_to_load)
-            if all_loaded and not self._chunk_load_queue:
+        # The set of chunks to keep loaded only changes when the player enters a
+        # new chunk; otherwise just carry on with queued and generating chunks
+        if center_chunk == self._last_player_chunk:
+            if not self._chunk_load_queue and not self._pending_chunks:
                 return
-        
-        # Unload chunks that are too far (do this immediately)
-        chunks_to_unload = []
-        for pos in self.chunks:
-            if pos not in chunks_to_load:
-                chunks_to_unload.append(pos)
-        
-        for pos in chunks_to_unload:
-            chunk = self.chunks.pop(pos)
-            destroy(chunk)
-        
-        # Queue chunks that need to be loaded
-        for pos in chunks_to_load:
-            if pos not in self.chunks and pos not in self._chunk_load_queue:
-                self._chunk_load_queue.append(pos)
-        
-        # First load is synchronous (load all chunks at once to prevent falling through ground)
+        else:
+            self._last_player_chunk = center_chunk
+            ccx, ccy, ccz = center_chunk
+            old_chunks_to_load = self._chunks_to_load
+            self._chunks_to_load = {(ccx + dx, ccy + dy, ccz + dz) for dx, dy, dz in self._render_offsets}
+            
+            # Unload chunks that are too far (do this immediately)
+            for pos in old_chunks_to_load - self._chunks_to_load:
+                chunk = self.chunks.pop(pos, None)
+                if chunk is not None:
+                    destroy(chunk)
+                    self._culling_chunks = None
+            
+            # Forget the heights of chunk columns that are no longer in range
+            self._columns_to_load = {(cx, cz) for cx, _, cz in self._chunks_to_load}
+            for column in list(self._height_cache):
+                if column not in self._columns_to_load:
+                    self._height_cache.pop(column, None)
+            
+            # Queue chunks that need to be loaded: the player's own and adjacent
+            # chunks and those in front of the camera first, nearest first within
+            # each tier. Priorities are relative to the player's chunk and view,
+            # so the heap is rebuilt here
+            self._queued_chunks.intersection_update(self._chunks_to_load)
+            self._queued_chunks.update(
+                pos for pos in self._chunks_to_load - old_chunks_to_load
+                if pos not in self.chunks and pos not in self._pending_chunks
+            )
+            forward = camera.forward if camera else Vec3(0, 0, 0)
+            self._chunk_load_queue = []
+            for cx, cy, cz in self._queued_chunks:
+                dx, dy, dz = cx - ccx, cy - ccy, cz - ccz
+                distance_sq = dx * dx + dy * dy + dz * dz
+                behind = distance_sq > 3 and dx * forward.x + dy * forward.y + dz * forward.z < 0
+                self._chunk_load_queue.append((behind, distance_sq, (cx, cy, cz)))
+            heapq.heapify(self._chunk_load_queue)
+        
+        # First load is synchronous (load all chunks at once to prevent falling through ground),
+        # but the terrain is still generated on all workers in parallel
         if not self._initial_load_complete:
-            while self._chunk_load_queue:
-                pos = self._chunk_load_queue.pop(0)
-                if pos not in self.chunks:
-                    self.chunks[pos] = self.generate_chunk(pos)
+            positions = [pos for *_, pos in sorted(self._chunk_load_queue) if pos not in self.chunks]
+            self._chunk_load_queue.clear()
+            self._queued_chunks.clear()
+            generated = self._generation_pool.map(self.generate_chunk_blocks, positions)
+            for pos, blocks in zip(positions, generated):
+                self._add_chunk(pos, blocks)
+            for pos in positions:
+                self.chunks[pos].generate_mesh()
             self._initial_load_complete = True
         else:
-            # Gradual loading for exploration (prevents frame stutter)
-            chunks_loaded = 0
-            while self._chunk_load_queue and chunks_loaded < self._chunks_per_frame:
-                pos = self._chunk_load_queue.pop(0)
+            # Gradual loading for exploration: keep the workers busy, and on the
+            # main thread only wrap a few finished chunks per frame
+            while self._chunk_load_queue and len(self._pending_chunks) < GENERATION_WORKERS * 2:
+                *_, pos = heapq.heappop(self._chunk_load_queue)
+                self._queued_chunks.discard(pos)
                 if pos not in self.chunks:
-                    self.chunks[pos] = self.generate_chunk(pos)
+                    self._pending_chunks[pos] = self._generation_pool.submit(self.generate_chunk_blocks, pos)
+            
+            chunks_loaded = 0
+            for pos, future in list(self._pending_chunks.items()):
+                if chunks_loaded >= self._chunks_per_frame:
+                    break
+                if not future.done():
+                    continue
+                
+                del self._pending_chunks[pos]
+                blocks = future.result()  # Re-raises any exception from the worker here
+                
+                # Skip chunks the player moved away from while they were generating
+                if pos in self._chunks_to_load:
+                    self.request_mesh(self._add_chunk(pos, blocks))
                     chunks_loaded += 1
+                else:
+                    # The worker may have cached its column's heights after the
+                    # column was evicted; drop them again
+                    cx, _, cz = pos
+                    if (cx, cz) not in self._columns_to_load:
+                        self._height_cache.pop((cx, cz), None)
+    
+    def _add_chunk(self, chunk_pos: Tuple[int, int, int], blocks: np.ndarray) -> Chunk:
+        """Wrap generated blocks in a Chunk entity and register it (main thread only)."""
+        chunk = Chunk(chunk_pos, self)
+        chunk.fill_from_array(blocks)
+        self.chunks[chunk_pos] = chunk
+        self._culling_chunks = None
+        return chunk
     
     def update_frustum_culling(self) -> None:
         """
@@ -305,53 +585,113 @@ class World(Entity):
         
         This is called every frame to optimize rendering.
         
-        Math:
-            1. Calculate vector from camera to chunk center
-            2. Calculate angle between camera forward and that vector
-            3. If angle > FOV/2 (with margin), hide the chunk
+        Math (for all chunks at once, as array operations):
+            1. Build the frustum's planes through the camera (near, left,
+               right, top, bottom) as inward unit normals
+            2. For each chunk box and plane, take the signed distance of the
+               box center plus the box's extent along the normal:
+               n . (center - camera) + h * (|nx| + |ny| + |nz|)
+            3. If that is negative for any plane, the whole box is outside
+               the frustum, so hide the chunk
+        
+        Most frames the camera only turns or moves a little, so a full pass
+        also records how far each chunk is from changing visibility. Later
+        frames bound how much any chunk's plane distances can have changed
+        since then and only recheck the chunks within that bound.
         """
         if not camera:
             return
         
         cam_pos = camera.world_position
-        cam_forward = camera.forward
+        position = np.array([cam_pos.x, cam_pos.y, cam_pos.z])
+        normals = self._frustum_normals()
+        half_extent = CHUNK_SIZE / 2
+        
+        recheck = None
+        if self._culling_chunks is None or len(self._culling_chunks) != len(self.chunks):
+            self._rebuild_culling_arrays()
+        else:
+            # A plane distance changes by at most the normal's drift times the
+            # chunk's distance (plus its box extent) and the camera's movement
+            moved = float(np.linalg.norm(position - self._culling_origin))
+            turned = float(np.linalg.norm(normals - self._culling_normals, axis=1).max())
+            if turned < _CULLING_MAX_DRIFT:
+                drift = turned * (self._culling_distance + half_extent * math.sqrt(3)) + moved + _CULLING_EPSILON
+                recheck = np.flatnonzero(self._culling_margin <= drift)
+                if not len(recheck) and self._culling_at_reference:
+                    return
+        
+        centers = self._culling_centers if recheck is None else self._culling_centers[:, recheck]
+        
+        # Distance of each box's innermost corner inside its worst plane: (N,).
+        # Plane distances are laid out (5, N) so the minimum over planes runs
+        # along contiguous rows rather than over many short ones
+        box_radius = half_extent * np.abs(normals).sum(axis=1)
+        plane_distance = normals @ centers
+        plane_distance += (box_radius - normals @ position)[:, None]
+        inside = plane_distance.min(axis=0)
+        in_view = inside >= 0
+        
+        if recheck is None:
+            # Full pass: measure margins against this camera pose
+            self._culling_margin = np.abs(inside)
+            to_chunk = centers - position[:, None]
+            self._culling_distance = np.sqrt((to_chunk * to_chunk).sum(axis=0))
+            self._culling_origin = position
+            self._culling_normals = normals
+            self._culling_reference_visible = in_view
+            visible = in_view
+        else:
+            # Chunks within their margin are as they were at the full pass
+            visible = self._culling_reference_visible.copy()
+            visible[recheck] = in_view
+        
+        # Setting Entity.visible is the expensive part, so only touch chunks that changed
+        for i in np.flatnonzero(visible != self._culling_visible):
+            self._culling_chunks[i].visible = bool(visible[i])
+        self._culling_visible = visible
+        self._culling_at_reference = recheck is None or not len(recheck)
+    
+    def _frustum_normals(self) -> np.ndarray:
+        """
+        Build the inward unit normals of the camera's frustum planes.
         
-        # Half FOV with some margin (in radians)
-        # Default Ursina FOV is ~90 degrees
-        half_fov = math.radians(60)  # Slightly larger than actual for safety
+        All planes pass through the camera, so a point p is inside plane k
+        when normals[k] . (p - camera) >= 0. The far plane is left out: chunks
+        are unloaded well before they reach the camera's far clip.
         
-        for chunk in self.chunks.values():
-            # Calculate chunk center in world space
-            chunk_center = chunk.position + Vec3(CHUNK_SIZE / 2, CHUNK_SIZE / 2, CHUNK_SIZE / 2)
-            
-            # Vector from camera to chunk
-            to_chunk = chunk_center - cam_pos
-            distance = to_chunk.length()
-            
-            # Always show very close chunks
-            if distance < CHUNK_SIZE * 2:
-                chunk.visible = True
-                continue
-            
-            # Normalize the direction
-            if distance > 0:
-                to_chunk_normalized = to_chunk / distance
-            else:
-                chunk.visible = True
-                continue
-            
-            # Calculate angle using dot product
-            # dot(a, b) = cos(angle) when both are normalized
-            dot = (cam_forward.x * to_chunk_normalized.x + 
-                   cam_forward.y * to_chunk_normalized.y + 
-                   cam_forward.z * to_chunk_normalized.z)
-            
-            # Clamp to avoid math domain errors
-            dot = max(-1, min(1, dot))
-            angle = math.acos(dot)
-            
-            # Show chunk if within view frustum
-            chunk.visible = angle < half_fov
+        Returns:
+            (5, 3) normals of the near, left, right, bottom and top planes
+        """
+        forward, right, up = camera.forward, camera.right, camera.up
+        forward = np.array([forward.x, forward.y, forward.z])
+        right = np.array([right.x, right.y, right.z])
+        up = np.array([up.x, up.y, up.z])
+        
+        # Whether camera.fov is horizontal or vertical depends on the lens
+        # setup, so apply it to the window's narrower axis and widen the other
+        # by the aspect ratio, which covers the real frustum either way
+        tan_half_fov = math.tan(math.radians(camera.fov) / 2)
+        aspect_ratio = camera.aspect_ratio
+        tan_x = tan_half_fov * max(aspect_ratio, 1.0)
+        tan_y = tan_half_fov * max(1.0 / aspect_ratio, 1.0)
+        
+        normals = np.array([
+            forward,
+            right + tan_x * forward,
+            -right + tan_x * forward,
+            up + tan_y * forward,
+            -up + tan_y * forward,
+        ])
+        return normals / np.linalg.norm(normals, axis=1, keepdims=True)
+    
+    def _rebuild_culling_arrays(self) -> None:
+        """Snapshot the loaded chunks into the arrays update_frustum_culling works on."""
+        self._culling_chunks = list(self.chunks.values())
+        positions = np.array([chunk.chunk_pos for chunk in self._culling_chunks],
+                             dtype=np.float64).reshape(-1, 3)
+        self._culling_centers = np.ascontiguousarray(positions.T * CHUNK_SIZE + CHUNK_SIZE / 2)
+        self._culling_visible = np.array([chunk.visible for chunk in self._culling_chunks], dtype=bool)
     
     def raycast_block(self, origin: Vec3, direction: Vec3, max_distance: float = 8.0) -> Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
         """
@@ -373,51 +713,29 @@ class World(Entity):
         
         direction = direction.normalized()
         
-        # Current voxel position
-        x = int(math.floor(origin.x))
-        y = int(math.floor(origin.y))
-        z = int(math.floor(origin.z))
-        
-        # Direction to step in each axis
-        step_x = 1 if direction.x >= 0 else -1
-        step_y = 1 if direction.y >= 0 else -1
-        step_z = 1 if direction.z >= 0 else -1
-        
-        # Distance to next voxel boundary for each axis
-        # Avoid division by zero
-        t_max_x = ((x + (1 if step_x > 0 else 0)) - origin.x) / direction.x if direction.x != 0 else float('inf')
-        t_max_y = ((y + (1 if step_y > 0 else 0)) - origin.y) / direction.y if direction.y != 0 else float('inf')
-        t_max_z = ((z + (1 if step_z > 0 else 0)) - origin.z) / direction.z if direction.z != 0 else float('inf')
-        
-        # How far to move in t for each voxel step
-        t_delta_x = abs(1 / direction.x) if direction.x != 0 else float('inf')
-        t_delta_y = abs(1 / direction.y) if direction.y != 0 else float('inf')
-        t_delta_z = abs(1 / direction.z) if direction.z != 0 else float('inf')
-        
-        prev_x, prev_y, prev_z = x, y, z
-        traveled = 0.0
-        
-        while traveled < max_distance:
-            # Check current voxel
-            block = self.get_block(x, y, z)
-            if block != BlockType.AIR:
-                return ((x, y, z), (prev_x, prev_y, prev_z))
-            
-            # Save previous position for block placement
-            prev_x, prev_y, prev_z = x, y, z
-            
-            # Step to next voxel
-            if t_max_x < t_max_y and t_max_x < t_max_z:
-                traveled = t_max_x
-                t_max_x += t_delta_x
-                x += step_x
-            elif t_max_y < t_max_z:
-                traveled = t_max_y
-                t_max_y += t_delta_y
-                y += step_y
-            else:
-                traveled = t_max_z
-                t_max_z += t_delta_z
-                z += step_z
-        
-        return None
+        # Copy the blocks the ray can pass through - its bounding box, plus
+        # a one-block margin - into a window, then step through it with the
+        # compiled DDA kernel
+        end_x = origin.x + direction.x * max_distance
+        end_y = origin.y + direction.y * max_distance
+        end_z = origin.z + direction.z * max_distance
+        x0 = math.floor(min(origin.x, end_x)) - 1
+        y0 = math.floor(min(origin.y, end_y)) - 1
+        z0 = math.floor(min(origin.z, end_z)) - 1
+        window = self.get_block_region(
+            x0, y0, z0,
+            math.floor(max(origin.x, end_x)) + 2 - x0,
+            math.floor(max(origin.y, end_y)) + 2 - y0,
+            math.floor(max(origin.z, end_z)) + 2 - z0,
+        )
+        
+        hit, x, y, z, prev_x, prev_y, prev_z = dda(
+            window,
+            origin.x - x0, origin.y - y0, origin.z - z0,
+            direction.x, direction.y, direction.z,
+            float(max_distance),
+        )
+        if not hit:
+            return None
+        
+        return ((x + x0, y + y0, z + z0), (prev_x + x0, prev_y + y0, prev_z + z0))